@@ -1,10 +1,10 @@
-"""Public API for kickstart generators."""
+"""Public API for kickstart generators.
+
+Generator modules are imported inside each ``create_*`` function so that
+commands which never scaffold (``--help``, ``version``, ``plan``) do not pay
+for Jinja, requests, and the stack registry at startup.
+"""
 
-from src.generator.service import ServiceGenerator
-from src.generator.frontend import FrontendGenerator
-from src.generator.lib import LibraryGenerator, CLIGenerator
-from src.generator.monorepo import MonorepoGenerator
-from src.generator.system import SystemGenerator
 from src.utils.types import GeneratorConfig
 
 __all__ = [
@@ -35,6 +35,8 @@ def create_service(name: str, lang: str, gh: bool, config: GeneratorConfig, *, h
         framework: HTTP framework (None for FastAPI default, minimal for standard library)
         runtime: Service execution profile (container or cloudflare-workers)
     """
+    from src.generator.service import ServiceGenerator
+
     generator = ServiceGenerator(
         name,
         lang,
@@ -53,18 +55,24 @@ def create_service(name: str, lang: str, gh: bool, config: GeneratorConfig, *, h
 
 def create_frontend(name: str, gh: bool, config: GeneratorConfig, *, root: str | None = None) -> None:
     """Create a frontend application."""
+    from src.generator.frontend import FrontendGenerator
+
     generator = FrontendGenerator(name, gh, config, root)
     generator.create()
 
 
 def create_lib(name: str, lang: str, gh: bool, config: GeneratorConfig, *, root: str | None = None) -> None:
     """Create a library project."""
+    from src.generator.lib import LibraryGenerator
+
     generator = LibraryGenerator(name, lang, gh, config, root)
     generator.create()
 
 
 def create_cli(name: str, lang: str, gh: bool, config: GeneratorConfig, *, root: str | None = None) -> None:
     """Create a CLI application."""
+    from src.generator.lib import CLIGenerator
+
     generator = CLIGenerator(name, lang, gh, config, root)
     generator.create()
 
@@ -82,6 +90,8 @@ def create_system(
     workspace_tooling: str = "none",
 ) -> None:
     """Create a system scaffold."""
+    from src.generator.system import SystemGenerator
+
     generator = SystemGenerator(
         name,
         gh,
@@ -109,6 +119,8 @@ def create_monorepo(
     workspace_tooling: str = "bun-turbo",
 ) -> None:
     """Create a system monorepo through the legacy API name."""
+    from src.generator.monorepo import MonorepoGenerator
+
     generator = MonorepoGenerator(
         name,
         gh,
@@ -1,5 +1,6 @@
 """Project creation dispatch for CLI commands."""
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Protocol, Unpack
 
@@ -9,10 +10,11 @@ from src.utils.errors import UnsupportedOptionError, UnsupportedProjectTypeError
 from src.utils.types import GeneratorConfig
 
 
-SYSTEM_PROJECT_TYPES = {"system"}
-LEGACY_MONOREPO_PROJECT_TYPES = {"mono", "monorepo"}
-HELM_PROJECT_TYPES = SYSTEM_PROJECT_TYPES | LEGACY_MONOREPO_PROJECT_TYPES | {"service"}
-KNOWN_PROJECT_TYPES = {"service", "frontend", "lib", "cli"} | SYSTEM_PROJECT_TYPES | LEGACY_MONOREPO_PROJECT_TYPES
+SYSTEM_PROJECT_TYPES = frozenset({"system"})
+LEGACY_MONOREPO_PROJECT_TYPES = frozenset({"mono", "monorepo"})
+SYSTEM_LIKE_PROJECT_TYPES = SYSTEM_PROJECT_TYPES | LEGACY_MONOREPO_PROJECT_TYPES
+HELM_PROJECT_TYPES = SYSTEM_LIKE_PROJECT_TYPES | {"service"}
+KNOWN_PROJECT_TYPES = frozenset({"service", "frontend", "lib", "cli"}) | SYSTEM_LIKE_PROJECT_TYPES
 
 
 class ServiceCreator(Protocol):
@@ -81,7 +83,7 @@ class ProjectCreators:
 def _reject_inapplicable_options(options: CreateOptions) -> None:
     """Refuse options that the selected project type would silently drop."""
     project_type = options.project_type
-    system_like = project_type in SYSTEM_PROJECT_TYPES | LEGACY_MONOREPO_PROJECT_TYPES
+    system_like = project_type in SYSTEM_LIKE_PROJECT_TYPES
 
     if options.helm and project_type not in HELM_PROJECT_TYPES:
         raise UnsupportedOptionError(
@@ -121,49 +123,66 @@ def _reject_inapplicable_options(options: CreateOptions) -> None:
 
 def dispatch_project_creation(options: CreateOptions, config: GeneratorConfig, creators: ProjectCreators) -> None:
     """Dispatch resolved create options to the appropriate project creator."""
-    if options.project_type not in KNOWN_PROJECT_TYPES:
+    create = _PROJECT_DISPATCH.get(options.project_type)
+    if create is None:
         raise UnsupportedProjectTypeError(
             f"Type '{options.project_type}' not supported. "
             "Use one of: service, frontend, lib, cli, system."
         )
 
     _reject_inapplicable_options(options)
+    create(options, config, creators)
+
+
+def _create_service(options: CreateOptions, config: GeneratorConfig, creators: ProjectCreators) -> None:
+    service_kwargs: ServiceCreateKwargs = {"helm": options.helm, "root": options.root}
+    if options.database is not None and options.database != "none":
+        service_kwargs["database"] = options.database
+    if options.cache is not None and options.cache != "none":
+        service_kwargs["cache"] = options.cache
+    if options.auth is not None and options.auth != "none":
+        service_kwargs["auth"] = options.auth
+    if options.framework is not None and options.framework != "fastapi":
+        service_kwargs["framework"] = options.framework
+    if options.runtime is not None:
+        service_kwargs["runtime"] = options.runtime
+
+    creators.service(options.name, options.lang, options.gh, config, **service_kwargs)
+
+
+def _create_frontend(options: CreateOptions, config: GeneratorConfig, creators: ProjectCreators) -> None:
+    creators.frontend(options.name, options.gh, config, root=options.root)
+
+
+def _create_lib(options: CreateOptions, config: GeneratorConfig, creators: ProjectCreators) -> None:
+    creators.lib(options.name, options.lang, options.gh, config, root=options.root)
+
 
-    if options.project_type == "service":
-        service_kwargs: ServiceCreateKwargs = {"helm": options.helm, "root": options.root}
-        if options.database is not None and options.database != "none":
-            service_kwargs["database"] = options.database
-        if options.cache is not None and options.cache != "none":
-            service_kwargs["cache"] = options.cache
-        if options.auth is not None and options.auth != "none":
-            service_kwargs["auth"] = options.auth
-        if options.framework is not None and options.framework != "fastapi":
-            service_kwargs["framework"] = options.framework
-        if options.runtime is not None:
-            service_kwargs["runtime"] = options.runtime
-
-        creators.service(options.name, options.lang, options.gh, config, **service_kwargs)
-        return
-
-    if options.project_type == "frontend":
-        creators.frontend(options.name, options.gh, config, root=options.root)
-        return
-
-    if options.project_type == "lib":
-        creators.lib(options.name, options.lang, options.gh, config, root=options.root)
-        return
-
-    if options.project_type == "cli":
-        creators.cli(options.name, options.lang, options.gh, config, root=options.root)
-        return
-
-    if options.project_type in SYSTEM_PROJECT_TYPES:
-        creators.system(options.name, options.gh, config, **_system_kwargs(options))
-        return
+def _create_cli(options: CreateOptions, config: GeneratorConfig, creators: ProjectCreators) -> None:
+    creators.cli(options.name, options.lang, options.gh, config, root=options.root)
 
+
+def _create_system(options: CreateOptions, config: GeneratorConfig, creators: ProjectCreators) -> None:
+    creators.system(options.name, options.gh, config, **_system_kwargs(options))
+
+
+def _create_monorepo(options: CreateOptions, config: GeneratorConfig, creators: ProjectCreators) -> None:
     creators.monorepo(options.name, options.gh, config, **_system_kwargs(options))
 
 
+ProjectDispatcher = Callable[[CreateOptions, GeneratorConfig, ProjectCreators], None]
+
+# One lookup per create replaces the former if-chain over project types.
+_PROJECT_DISPATCH: dict[str, ProjectDispatcher] = {
+    "service": _create_service,
+    "frontend": _create_frontend,
+    "lib": _create_lib,
+    "cli": _create_cli,
+    **dict.fromkeys(SYSTEM_PROJECT_TYPES, _create_system),
+    **dict.fromkeys(LEGACY_MONOREPO_PROJECT_TYPES, _create_monorepo),
+}
+
+
 def _system_kwargs(options: CreateOptions) -> SystemCreateKwargs:
     """Return keyword args common to system-like project creation."""
     system_kwargs: SystemCreateKwargs = {"helm": options.helm, "root": options.root}
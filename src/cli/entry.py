@@ -0,0 +1,85 @@
+"""Process entry point for the kickstart console script and binary.
+
+Typer remains the command framework (see
+``docs/decisions/cli-framework-research.md``), but importing it together with
+every command module costs far more than the cheapest invocations need.
+Argument shapes that can be answered with the standard library alone are
+handled here before ``src.cli.main`` is imported.
+"""
+
+import os
+import sys
+from collections.abc import Sequence
+
+from src import __version__
+
+VERSION_ARGS = frozenset({("version",), ("--version",)})
+HELP_ARGS = frozenset({(), ("-h",), ("--help",)})
+
+# Top-level commands in registration order. Kept in sync with the Typer app by
+# tests/unit/cli/test_entry.py; subcommand help still comes from Typer.
+COMMAND_SUMMARIES: tuple[tuple[str, str], ...] = (
+    ("version", "Show the current version."),
+    ("upgrade", "Upgrade to the latest version."),
+    ("plan", "Show how managed docs differ from the standard's render (read-only)."),
+    ("adopt", "Check an existing repo against the kickstart scaffold standard (read-only)."),
+    ("install", "Install the kickstart binary to a user-writable directory and help configure PATH."),
+    ("uninstall", "Remove an installed kickstart binary and optionally restore the shell rc file."),
+    ("completion", "Generate shell completion script."),
+    ("create", "Create a new service, lib, CLI, frontend, or system."),
+    ("telemetry", "Inspect and control default-on pseudonymous telemetry."),
+    ("export", "Deterministic exporters derived from scaffold state."),
+)
+
+
+def _styled(text: str) -> str:
+    """Return bold cyan text for terminals, plain text otherwise."""
+    if "NO_COLOR" in os.environ or not sys.stdout.isatty():
+        return text
+    return f"\033[1;36m{text}\033[0m"
+
+
+def print_version() -> None:
+    """Print the version line without importing Rich."""
+    sys.stdout.write(_styled(f"kickstart v{__version__}") + "\n")
+
+
+def print_static_help() -> None:
+    """Print top-level usage without importing Typer or any command module."""
+    width = max(len(name) for name, _ in COMMAND_SUMMARIES)
+    lines = [
+        "Usage: kickstart [OPTIONS] COMMAND [ARGS]...",
+        "",
+        f"  kickstart v{__version__}: Full-stack project scaffolding CLI",
+        "",
+        "Options:",
+        "  --version             Show the version and exit.",
+        "  --install-completion  Install completion for the current shell.",
+        "  --show-completion     Show completion for the current shell.",
+        "  --help, -h            Show this message and exit.",
+        "",
+        "Commands:",
+        *(f"  {name.ljust(width)}  {summary}" for name, summary in COMMAND_SUMMARIES),
+        "",
+        "Run 'kickstart COMMAND --help' for command options.",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Answer stdlib-only invocations directly, otherwise run the Typer app."""
+    args = tuple(sys.argv[1:] if argv is None else argv)
+    if args in VERSION_ARGS:
+        print_version()
+        return
+    if args in HELP_ARGS:
+        print_static_help()
+        return
+
+    from src.cli.main import app
+
+    app(args=list(args), prog_name="kickstart")
+
+
+if __name__ == "__main__":
+    main()
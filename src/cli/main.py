@@ -6,12 +6,11 @@ from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from time import monotonic
-from typing import Optional, cast
+from typing import Optional
 
 import typer
 from rich import print
 from rich.markup import escape
-from rich.prompt import Confirm, Prompt
 
 from src import __version__
 from src.api import (
@@ -23,15 +22,8 @@ from src.api import (
     create_system,
 )
 from src.cli.dispatch import ProjectCreators, dispatch_project_creation
-from src.generator.adoption import AdoptionTargetError, inspect_repo
-from src.generator.backstage_export import (
-    BackstageExportError,
-    BackstageExportUsageError,
-    export_backstage,
-)
-from src.generator.docs_plan import DocsPlanTargetError, inspect_docs
 from src.cli.options import CreateCommandOptions, CreateOptions, ResolvedCreateArgs
-from src.cli.prompts import ConfirmReader, PromptReader, prompt_for_missing_args
+from src.cli.prompts import prompt_for_missing_args, prompt_readers
 from src.cli.telemetry import telemetry_app
 from src.model.dto.telemetry import (
     CliArtifactKind,
@@ -72,7 +64,6 @@ from src.utils.installer import (
     update_path_in_rc,
 )
 from src.utils.types import GeneratorConfig
-from src.utils.updater import check_for_update
 
 logger = logging.getLogger(__name__)
 
@@ -108,6 +99,8 @@ def version() -> None:
 @app.command()
 def upgrade() -> None:
     """Upgrade to the latest version."""
+    from src.utils.updater import check_for_update
+
     started_at = monotonic()
     result: UpgradeResult | None = None
     try:
@@ -153,6 +146,12 @@ def backstage(
     1 = exported with validation issues or refused (unfenced existing file),
     2 = usage error (no repo or no usable manifest).
     """
+    from src.generator.backstage_export import (
+        BackstageExportError,
+        BackstageExportUsageError,
+        export_backstage,
+    )
+
     try:
         result = export_backstage(path)
     except BackstageExportUsageError as error:
@@ -179,6 +178,8 @@ def plan(
     render from `.kickstart/scaffold.json`. Exit codes: 0 = in sync, 1 = drift
     or structural findings, 2 = usage error (no repo or no plannable manifest).
     """
+    from src.generator.docs_plan import DocsPlanTargetError, inspect_docs
+
     try:
         report = inspect_docs(path)
     except DocsPlanTargetError as error:
@@ -218,6 +219,8 @@ def adopt(
         print("[red]kickstart adopt only supports --check for now; writing is a future, explicit step.[/]")
         raise typer.Exit(code=2)
 
+    from src.generator.adoption import AdoptionTargetError, inspect_repo
+
     try:
         report = inspect_repo(path)
     except AdoptionTargetError as error:
@@ -550,6 +553,7 @@ def _prompt_for_missing_args(
     workspace_tooling: Optional[str] = None,
 ) -> ResolvedCreateArgs:
     """Prompt user for any missing arguments in interactive mode."""
+    prompt_reader, confirm_reader = prompt_readers()
     options = prompt_for_missing_args(
         CreateCommandOptions(
             project_type=project_type,
@@ -568,8 +572,8 @@ def _prompt_for_missing_args(
             workspace_tooling=workspace_tooling,
         ),
         config,
-        prompt=cast(PromptReader, Prompt),
-        confirm=cast(ConfirmReader, Confirm),
+        prompt=prompt_reader,
+        confirm=confirm_reader,
     )
     return options.as_tuple()
 
@@ -720,11 +724,12 @@ def create(
     error_category = ScaffoldCreateErrorCategory.UNEXPECTED_ERROR
     try:
         config: GeneratorConfig = load_config()
+        prompt_reader, confirm_reader = prompt_readers()
         options = prompt_for_missing_args(
             command_options,
             config,
-            prompt=cast(PromptReader, Prompt),
-            confirm=cast(ConfirmReader, Confirm),
+            prompt=prompt_reader,
+            confirm=confirm_reader,
         )
         telemetry_context = _scaffold_create_context(options, interactive=interactive)
         dispatch_project_creation(options, config, _project_creators())
@@ -1,13 +1,23 @@
 """Interactive prompt handling for CLI create options."""
 
+import sys
+from collections.abc import Sequence
 from typing import Protocol, cast
 
 from rich import print
 
+from src.cli.dispatch import HELM_PROJECT_TYPES
 from src.cli.options import CreateCommandOptions, CreateOptions
 from src.utils.errors import MissingCreateArgumentsError
 from src.utils.types import GeneratorConfig
 
+# Wizard choices are built once; Rich and the plain readers only read them.
+PROJECT_TYPE_CHOICES = ("service", "frontend", "lib", "cli", "system")
+DATABASE_CHOICES = ("none", "postgres")
+CACHE_CHOICES = ("none", "redis")
+AUTH_CHOICES = ("none", "jwt")
+FRAMEWORK_CHOICES = ("fastapi", "minimal")
+
 
 class PromptReader(Protocol):
     """Prompt API used by interactive create flows."""
@@ -16,7 +26,7 @@ class PromptReader(Protocol):
         self,
         prompt: str,
         *,
-        choices: list[str] | None = None,
+        choices: Sequence[str] | None = None,
         default: str | None = None,
     ) -> str:
         """Ask for a string value."""
@@ -29,6 +39,93 @@ class ConfirmReader(Protocol):
         """Ask for a yes/no value."""
 
 
+class RichPrompt:
+    """Prompt reader backed by ``rich.prompt.Prompt``, imported on first use.
+
+    ``rich.prompt`` pulls in the full Rich console stack, so fully specified
+    (non-interactive) create commands never import it.
+    """
+
+    def ask(
+        self,
+        prompt: str,
+        *,
+        choices: Sequence[str] | None = None,
+        default: str | None = None,
+    ) -> str:
+        """Ask for a string value."""
+        from rich.prompt import Prompt
+
+        rich_choices = list(choices) if choices is not None else None
+        if default is None:
+            return Prompt.ask(prompt, choices=rich_choices)
+        return Prompt.ask(prompt, choices=rich_choices, default=default)
+
+
+class RichConfirm:
+    """Confirmation reader backed by ``rich.prompt.Confirm``, imported on first use."""
+
+    def ask(self, prompt: str, *, default: bool = False) -> bool:
+        """Ask for a yes/no value."""
+        from rich.prompt import Confirm
+
+        return Confirm.ask(prompt, default=default)
+
+
+class PlainPrompt:
+    """Prompt reader using builtin ``input()`` for piped or redirected stdin.
+
+    Styled Rich prompts add nothing when nobody is watching a terminal, so
+    scripted wizards read answers line by line with the same choice checks.
+    """
+
+    def ask(
+        self,
+        prompt: str,
+        *,
+        choices: Sequence[str] | None = None,
+        default: str | None = None,
+    ) -> str:
+        """Ask for a string value."""
+        choice_hint = f" [{'/'.join(choices)}]" if choices else ""
+        default_hint = f" ({default})" if default is not None else ""
+        while True:
+            answer = input(f"{prompt}{choice_hint}{default_hint}: ").strip()
+            if not answer and default is not None:
+                return default
+            if choices is None or answer in choices:
+                return answer
+            sys.stdout.write("Please select one of the available options\n")
+
+
+class PlainConfirm:
+    """Confirmation reader using builtin ``input()`` for piped or redirected stdin."""
+
+    def ask(self, prompt: str, *, default: bool = False) -> bool:
+        """Ask for a yes/no value."""
+        default_hint = "y" if default else "n"
+        while True:
+            answer = input(f"{prompt} [y/n] ({default_hint}): ").strip().lower()
+            if not answer:
+                return default
+            if answer in ("y", "yes"):
+                return True
+            if answer in ("n", "no"):
+                return False
+            sys.stdout.write("Please enter Y or N\n")
+
+
+def _stdin_is_tty() -> bool:
+    return sys.stdin.isatty()
+
+
+def prompt_readers() -> tuple[PromptReader, ConfirmReader]:
+    """Return Rich readers for a terminal and plain ``input()`` readers otherwise."""
+    if _stdin_is_tty():
+        return RichPrompt(), RichConfirm()
+    return PlainPrompt(), PlainConfirm()
+
+
 def prompt_for_missing_args(
     options: CreateCommandOptions,
     config: GeneratorConfig,
@@ -53,58 +150,62 @@ def prompt_for_missing_args(
     workspace_tooling = options.workspace_tooling
     interactive_mode = not project_type or not name
 
-    if not project_type:
-        print("[bold cyan]Launching interactive wizard...\n[/]")
-        project_type = prompt.ask(
-            "What do you want to create?",
-            choices=["service", "frontend", "lib", "cli", "system"],
-        )
-        name = prompt.ask("Project name?")
-        if root is None:
-            root = prompt.ask("Where should the project be created?")
-        default_language = cast(str, config.get("default_language", "python"))
-        lang = prompt.ask("Language", default=default_language)
-        gh = confirm.ask("Create GitHub repo?", default=False)
-        if project_type in ["mono", "monorepo", "system", "service"]:
-            helm = confirm.ask("Use Helm scaffolding?", default=False)
-
-    if project_type == "service" and interactive_mode:
-        if lang == "python":
-            if database is None:
-                database = prompt.ask("Database extension", choices=["none", "postgres"], default="none")
+    # Fully specified commands skip every prompt and choice check below.
+    if interactive_mode:
+        if not project_type:
+            print("[bold cyan]Launching interactive wizard...\n[/]")
+            project_type = prompt.ask(
+                "What do you want to create?",
+                choices=PROJECT_TYPE_CHOICES,
+            )
+            name = prompt.ask("Project name?")
+            if root is None:
+                root = prompt.ask("Where should the project be created?")
+            default_language = cast(str, config.get("default_language", "python"))
+            lang = prompt.ask("Language", default=default_language)
+            # --gh/--helm passed alongside the wizard already answer these.
+            if not gh:
+                gh = confirm.ask("Create GitHub repo?", default=False)
+            if project_type in HELM_PROJECT_TYPES and not helm:
+                helm = confirm.ask("Use Helm scaffolding?", default=False)
+
+        if project_type == "service":
+            if lang == "python":
+                if database is None:
+                    database = prompt.ask("Database extension", choices=DATABASE_CHOICES, default="none")
+                    if database == "none":
+                        database = None
+
+                if cache is None:
+                    cache = prompt.ask("Cache extension", choices=CACHE_CHOICES, default="none")
+                    if cache == "none":
+                        cache = None
+
+                if auth is None:
+                    auth = prompt.ask("Authentication extension", choices=AUTH_CHOICES, default="none")
+                    if auth == "none":
+                        auth = None
+
+                if framework is None:
+                    framework = prompt.ask("HTTP framework", choices=FRAMEWORK_CHOICES, default="fastapi")
+                    if framework == "fastapi":
+                        framework = None
+
+            if lang in ("typescript", "ts") and database is None:
+                database = prompt.ask("Database extension", choices=DATABASE_CHOICES, default="none")
                 if database == "none":
                     database = None
 
-            if cache is None:
-                cache = prompt.ask("Cache extension", choices=["none", "redis"], default="none")
-                if cache == "none":
-                    cache = None
-
-            if auth is None:
-                auth = prompt.ask("Authentication extension", choices=["none", "jwt"], default="none")
-                if auth == "none":
-                    auth = None
-
-            if framework is None:
-                framework = prompt.ask("HTTP framework", choices=["fastapi", "minimal"], default="fastapi")
-                if framework == "fastapi":
-                    framework = None
-
-        if lang in ("typescript", "ts") and database is None:
-            database = prompt.ask("Database extension", choices=["none", "postgres"], default="none")
-            if database == "none":
-                database = None
-
-        if lang == "rust":
-            if cache is None:
-                cache = prompt.ask("Cache extension", choices=["none", "redis"], default="none")
-                if cache == "none":
-                    cache = None
-
-            if auth is None:
-                auth = prompt.ask("Authentication extension", choices=["none", "jwt"], default="none")
-                if auth == "none":
-                    auth = None
+            if lang == "rust":
+                if cache is None:
+                    cache = prompt.ask("Cache extension", choices=CACHE_CHOICES, default="none")
+                    if cache == "none":
+                        cache = None
+
+                if auth is None:
+                    auth = prompt.ask("Authentication extension", choices=AUTH_CHOICES, default="none")
+                    if auth == "none":
+                        auth = None
 
     if project_type is None or name is None:
         raise MissingCreateArgumentsError(
@@ -2,6 +2,7 @@ import os
 import re
 import logging
 from collections.abc import Callable, Sequence
+from functools import partial
 from pathlib import Path
 
 from src.generator.file_plan import ContentFile
@@ -12,7 +13,7 @@ from src.generator.projections import (
     scaffold_docs_projections,
 )
 from src.generator.scaffold_contract import ScaffoldContract
-from src.generator.template_plan import TemplatePlan, TemplatePlanEntry
+from src.generator.template_plan import TemplatePlan
 from src.stack.toolchain_versions import toolchain_vars
 from src.stack.types import TemplateConfig
 from src.utils.fs import get_template_engine, write_file
@@ -20,11 +21,11 @@ from src.utils.logger import success, warn
 from src.utils.template_registry import get_template_registry, TemplateRegistry
 from src.utils.types import GeneratorConfig, TemplateValue, TemplateVars
 from src.utils.error_handling import (
-    ErrorCollector, batch_operation_wrapper, handle_file_operations,
+    ErrorCollector, handle_file_operations,
     handle_template_operations, safe_operation_context,
     ensure_directory_exists,
 )
-from src.utils.errors import InvalidProjectNameError, ProjectCreationError, TemplateError
+from src.utils.errors import InvalidProjectNameError, ProjectCreationError
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,9 @@ logger = logging.getLogger(__name__)
 PROJECT_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9_-]*$")
 PROJECT_NAME_MAX_LENGTH = 64
 
+# Root of the bundled templates; computed once instead of per generator.
+TEMPLATES_ROOT = Path(__file__).parent.parent / "templates"
+
 
 def validate_project_name(name: str) -> str:
     """Return the name when valid; raise a specific error otherwise."""
@@ -60,6 +64,7 @@ class BaseGenerator:
         project: Path to the project directory
         template_dir: Path to the template directory
         template_registry: Registry for managing templates
+        gh: Whether to create a GitHub repository after scaffolding
     """
     
     name: str
@@ -67,6 +72,7 @@ class BaseGenerator:
     project: Path
     template_dir: Path
     template_registry: TemplateRegistry
+    gh: bool = False
     
     def __init__(self, name: str, config: GeneratorConfig, root: str | None = None) -> None:
         """Initialize the base generator.
@@ -79,9 +85,9 @@ class BaseGenerator:
         self.name = validate_project_name(name)
         self.config = config
         self.project = Path(root) / name if root else Path(name)
-        self.template_dir = Path(__file__).parent.parent / "templates"
-        self._templates_root = self.template_dir
-        self.template_registry = get_template_registry(self.template_dir)
+        self.template_dir = TEMPLATES_ROOT
+        self._templates_root = TEMPLATES_ROOT
+        self.template_registry = get_template_registry(TEMPLATES_ROOT)
 
     def create_project(self) -> bool:
         """Check if the project directory exists.
@@ -107,22 +113,22 @@ class BaseGenerator:
         Returns:
             True if all directories were created successfully, False otherwise
         """
-        def create_single_directory(directory: str) -> bool:
-            """Create a single directory with centralized error handling."""
+        targets = {self.project / directory for directory in directories}
+        # mkdir(parents=True) on a leaf also creates its ancestors, so targets
+        # that are a parent of another target need no call of their own.
+        ancestors = {parent for target in targets for parent in target.parents}
+
+        collector = ErrorCollector("Directory creation")
+        for target in sorted(targets - ancestors):
+            collector.increment_total()
             try:
-                ensure_directory_exists(self.project / directory)
-                return True
-            except Exception:
-                return False
-
-        # Use batch operation wrapper for standardized error collection
-        collector = batch_operation_wrapper(
-            items=directories,
-            operation_func=create_single_directory,
-            operation_name="Directory creation",
-            item_name_func=lambda d: f"{self.project / d}"
-        )
+                target.mkdir(parents=True, exist_ok=True)
+            except OSError as exc:
+                collector.add_error(f"Failed to create directory '{target}': {exc}")
+            else:
+                collector.increment_success()
 
+        collector.log_summary()
         return not collector.has_errors()
 
     @handle_template_operations(default_return=False, log_errors=True)
@@ -138,18 +144,11 @@ class BaseGenerator:
             True if file was written successfully, False otherwise
         """
         resolved_template_path: Path | str
-        if isinstance(template_path, str) and not Path(template_path).is_absolute():
-            if template_path.startswith("_shared/"):
-                resolved_template_path = self._templates_root / template_path
-            else:
-                resolved_template_path = self.template_dir / template_path
+        if isinstance(template_path, str) and not os.path.isabs(template_path):
+            resolved_template_path = self.template_registry.resolve_template_file(self.template_dir, template_path)
         else:
             resolved_template_path = template_path
 
-        # Check if template exists
-        if isinstance(resolved_template_path, Path) and not resolved_template_path.exists():
-            raise TemplateError(f"Template file not found: {template_path}")
-
         template_vars = {
             "service_name": self.name,
             "package_name": self._package_name(),
@@ -157,7 +156,7 @@ class BaseGenerator:
             **vars,
         }
         write_file(self.project / target, resolved_template_path, **template_vars)
-        logger.debug(f"Successfully wrote template {template_path} to {target}")
+        logger.debug("Successfully wrote template %s to %s", template_path, target)
         return True
 
     @handle_file_operations(default_return=False, log_errors=True)
@@ -177,7 +176,7 @@ class BaseGenerator:
             service_name=self.name,
             package_name=self._package_name(),
         )
-        logger.debug(f"Successfully wrote content to {target}")
+        logger.debug("Successfully wrote content to %s", target)
         return True
 
     def write_content_files(self, files: Sequence[ContentFile]) -> bool:
@@ -263,8 +262,7 @@ class BaseGenerator:
         Returns:
             True if architecture docs were created successfully, False otherwise
         """
-        if not self.create_directories(["docs/architecture"]):
-            return False
+        # write_content creates docs/architecture/ as the README's parent.
         projection = architecture_readme_projection(title, directories, contract)
         return self.write_content(projection.target, projection.content)
 
@@ -325,20 +323,33 @@ class BaseGenerator:
         Returns:
             True if all templates were written successfully, False otherwise
         """
-        def write_single_template(entry: TemplatePlanEntry) -> bool:
-            """Write a single template entry."""
-            return self.write_template(entry.target, entry.template, **entry.vars)
-
-        # Use batch operation wrapper for standardized error collection
-        collector = batch_operation_wrapper(
-            items=template_plan.entries(),
-            operation_func=write_single_template,
-            operation_name="Template writing",
-            item_name_func=lambda entry: f"{entry.target} (from {entry.template})"
-        )
+        collector = ErrorCollector("Template writing")
+        # Entries are already typed; iterate them directly and only format
+        # an item label when something fails.
+        for entry in template_plan.entries():
+            collector.increment_total()
+            try:
+                written = self.write_template(entry.target, entry.template, **entry.vars)
+            except Exception as exc:
+                collector.add_error(f"Exception processing {entry.target} (from {entry.template}): {exc}")
+                continue
+            if written:
+                collector.increment_success()
+            else:
+                collector.add_error(f"Operation failed for {entry.target} (from {entry.template})")
 
+        collector.log_summary()
         return not collector.has_errors()
 
+    def github_create_fn(self) -> Callable[[], bool | None] | None:
+        """Return the GitHub repository creation step, or None without ``gh``."""
+        if not self.gh:
+            return None
+        # Imported here so scaffolds without --gh never load requests.
+        from src.utils.github import create_repo
+
+        return partial(create_repo, self.name)
+
     def create_with_github(self, success_message: str, create_repo_fn: Callable[[], bool | None] | None = None) -> None:
         """Create project and optionally create GitHub repository.
         
@@ -380,56 +391,36 @@ class BaseGenerator:
                 "already exists or is not accessible."
             )
 
-        # Use error collector for standardized error tracking
-        error_collector = ErrorCollector("Project creation")
-
-        # Create project structure
-        if not self.init_basic_structure(directories):
-            error_collector.add_error("Failed to create directory structure")
-        else:
-            error_collector.increment_success()
-        error_collector.increment_total()
-
-        # Write template files
-        if not self.write_templates_from_plan(template_plan):
-            error_collector.add_error("Failed to write template files")
-        else:
-            error_collector.increment_success()
-        error_collector.increment_total()
-
-        # Create architecture docs
-        with safe_operation_context("Architecture documentation creation", log_errors=True):
-            if not self.create_architecture_docs(architecture_title, directories, scaffold_contract):
-                error_collector.add_error("Failed to create architecture documentation")
-            else:
-                error_collector.increment_success()
-        error_collector.increment_total()
-
-        # Create the generated scaffold contract
-        with safe_operation_context("Scaffold contract documentation creation", log_errors=True):
-            if not self.create_scaffold_contract_docs(scaffold_contract):
-                error_collector.add_error("Failed to create scaffold contract documentation")
-            else:
-                error_collector.increment_success()
-        error_collector.increment_total()
-
-        # Language-specific setup
+        # Each step reports success as a bool; its message names the failure.
+        steps: list[tuple[str, Callable[[], bool]]] = [
+            ("Failed to create directory structure", partial(self.init_basic_structure, directories)),
+            ("Failed to write template files", partial(self.write_templates_from_plan, template_plan)),
+            (
+                "Failed to create architecture documentation",
+                partial(self.create_architecture_docs, architecture_title, directories, scaffold_contract),
+            ),
+            (
+                "Failed to create scaffold contract documentation",
+                partial(self.create_scaffold_contract_docs, scaffold_contract),
+            ),
+        ]
         if language_setup_fn:
-            with safe_operation_context("Language-specific setup", log_errors=True):
-                if not language_setup_fn():
-                    error_collector.add_error("Language-specific setup failed")
-                else:
-                    error_collector.increment_success()
-            error_collector.increment_total()
-
-        # Additional setup
+            steps.append(("Language-specific setup failed", language_setup_fn))
         if additional_setup_fn:
-            with safe_operation_context("Additional setup", log_errors=True):
-                if not additional_setup_fn():
-                    error_collector.add_error("Additional setup failed")
-                else:
-                    error_collector.increment_success()
+            steps.append(("Additional setup failed", additional_setup_fn))
+
+        error_collector = ErrorCollector("Project creation")
+        for failure_message, step in steps:
             error_collector.increment_total()
+            try:
+                succeeded = step()
+            except Exception as exc:
+                logger.error("%s: %s", failure_message, exc, exc_info=True)
+                succeeded = False
+            if succeeded:
+                error_collector.increment_success()
+            else:
+                error_collector.add_error(failure_message)
 
         # Fail before announcing success or creating a GitHub repo: a partial
         # scaffold must never produce a success banner or remote side effects.
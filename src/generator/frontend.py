@@ -1,11 +1,12 @@
-from src.generator.base import BaseGenerator
+from src.generator.base import TEMPLATES_ROOT, BaseGenerator
 from src.generator.layouts import frontend_directories
 from src.generator.scaffold_contract import ScaffoldArtifacts, ScaffoldContract
 from src.generator.specs import FrontendSpec
 from src.generator.template_plans import frontend_template_plan
-from src.utils.github import create_repo
 from src.utils.types import GeneratorConfig
 
+REACT_TEMPLATES = TEMPLATES_ROOT / "react"
+
 class FrontendGenerator(BaseGenerator):
     gh: bool
     spec: FrontendSpec
@@ -14,7 +15,7 @@ class FrontendGenerator(BaseGenerator):
         spec = FrontendSpec(name=name, gh=gh, config=config, root=root)
         super().__init__(spec.name, spec.config, spec.root)
         self.spec = spec
-        self.template_dir = self.template_dir / "react"
+        self.template_dir = REACT_TEMPLATES
         self.gh = spec.gh
 
     def create(self) -> None:
@@ -24,9 +25,6 @@ class FrontendGenerator(BaseGenerator):
         architecture_title: str = f"{self.name} Frontend Docs"
         success_message: str = f"Frontend app '{self.name}' created successfully in '{self.project}'!"
         
-        def github_create_fn() -> bool | None:
-            return create_repo(self.name) if self.gh else None
-
         self.execute_create_flow(
             directories=directories,
             template_plan=template_plan,
@@ -38,5 +36,5 @@ class FrontendGenerator(BaseGenerator):
                 artifacts=ScaffoldArtifacts(static_site="vite", image="dockerfile"),
             ),
             success_message=success_message,
-            github_create_fn=github_create_fn if self.gh else None
+            github_create_fn=self.github_create_fn()
         )
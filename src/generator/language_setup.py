@@ -37,6 +37,7 @@ int main() {
 }
 """
 
+DEFAULT_ENV_EXAMPLE_CONTENT = "EXAMPLE_ENV_VAR=value\n"
 TYPESCRIPT_ENV_EXAMPLE_CONTENT = """HOST=0.0.0.0
 PORT=8080
 LOG_LEVEL=info
@@ -125,6 +126,7 @@ def cpp_service_content_files() -> tuple[ContentFile, ...]:
         ContentFile("src/api/routes.hpp", CPP_ROUTES_HEADER_CONTENT),
         ContentFile("src/model/user.hpp", CPP_USER_HEADER_CONTENT),
         ContentFile("src/main.cpp", CPP_MAIN_CONTENT),
+        ContentFile(".env.example", DEFAULT_ENV_EXAMPLE_CONTENT),
     )
 
 
@@ -135,6 +137,7 @@ def go_service_content_files() -> tuple[ContentFile, ...]:
         ContentFile("src/model/.gitkeep", ""),
         ContentFile("tests/api/.gitkeep", ""),
         ContentFile("tests/model/.gitkeep", ""),
+        ContentFile(".env.example", DEFAULT_ENV_EXAMPLE_CONTENT),
     )
 
 
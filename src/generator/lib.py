@@ -12,7 +12,6 @@ from src.generator.template_plans import cli_template_plan, library_template_pla
 from src.stack.profile import stack_registry
 from src.stack.types import TemplateConfig
 from src.utils.errors import LanguageNotSupportedError
-from src.utils.github import create_repo
 from src.utils.types import GeneratorConfig
 
 
@@ -154,9 +153,6 @@ class LibraryGenerator(BaseGenerator):
         language_setup_fn: Callable[[], bool],
     ) -> None:
         """Create a package-like project using the shared generator flow."""
-        def github_create_fn() -> bool | None:
-            return create_repo(self.name) if self.gh else None
-
         self.execute_create_flow(
             directories=directories,
             template_plan=template_plan,
@@ -164,7 +160,7 @@ class LibraryGenerator(BaseGenerator):
             scaffold_contract=scaffold_contract,
             success_message=success_message,
             language_setup_fn=language_setup_fn,
-            github_create_fn=github_create_fn if self.gh else None,
+            github_create_fn=self.github_create_fn(),
         )
     
     def _setup_language_specific_files(self) -> bool:
@@ -1,12 +1,17 @@
 from src.generator.base import BaseGenerator
-from src.utils.github import create_repo
 from src.stack.profile import stack_registry, SystemSelection
 from src.generator.layouts import system_directories
 from src.generator.scaffold_contract import ScaffoldArtifacts, ScaffoldContract
 from src.generator.specs import SystemSpec
 from src.generator.template_plan import TemplatePlan
+from src.stack.types import TemplateConfig
 from src.utils.types import GeneratorConfig, TemplateValue
 
+SYSTEM_ROOT_TEMPLATES = (
+    TemplateConfig("Makefile", "Makefile.tpl"),
+    TemplateConfig("README.md", "README.md.tpl"),
+)
+
 
 class SystemGenerator(BaseGenerator):
     helm: bool
@@ -76,9 +81,6 @@ class SystemGenerator(BaseGenerator):
             f"with {self._artifact_label()} artifacts in '{self.project}'."
         )
         
-        def github_create_fn() -> bool | None:
-            return create_repo(self.name) if self.gh else None
-        
         self.execute_create_flow(
             directories=directories,
             template_plan=template_plan,
@@ -95,7 +97,7 @@ class SystemGenerator(BaseGenerator):
             ),
             success_message=success_message,
             additional_setup_fn=self._setup_system_specific,
-            github_create_fn=github_create_fn if self.gh else None
+            github_create_fn=self.github_create_fn()
         )
     
     def _setup_system_specific(self) -> bool:
@@ -108,8 +110,7 @@ class SystemGenerator(BaseGenerator):
                 self._create_kustomize_structure()
         
         # Write documentation and configuration with variables
-        self.write_template("Makefile", "Makefile.tpl", **self._template_vars())
-        self.write_template("README.md", "README.md.tpl", **self._template_vars())
+        self.write_template_configs(SYSTEM_ROOT_TEMPLATES, self._template_vars())
         return True
 
     def _validate_options(self) -> None:
@@ -216,15 +217,20 @@ class SystemGenerator(BaseGenerator):
             *[f"infra/k8s/overlays/{env}" for env in stack_registry.environments]
         ])
 
-        template_vars = self._template_vars()
-        self.write_template_configs(stack_registry.kustomize_template_configs(), template_vars)
-
-        for env in stack_registry.environments:
-            self.write_template(
+        overlays = [
+            TemplateConfig(
                 f"infra/k8s/overlays/{env}/kustomization.yaml",
                 "kustomize/overlay-kustomization.yaml",
-                **{**template_vars, "environment": env},
+                {"environment": env},
             )
+            for env in stack_registry.environments
+        ]
+        self.write_template_configs(
+            [*stack_registry.kustomize_template_configs(), *overlays],
+            self._template_vars(),
+        )
+
+
 class MonorepoGenerator(SystemGenerator):
     """Legacy monorepo generator.
 
@@ -1,7 +1,9 @@
+import os
 from pathlib import Path
 import logging
 from src.generator.base import BaseGenerator
 from src.generator.language_setup import (
+    DEFAULT_ENV_EXAMPLE_CONTENT,
     cpp_service_content_files,
     go_service_content_files,
     go_service_content_templates,
@@ -13,7 +15,6 @@ from src.generator.language_setup import (
 )
 from src.generator.template_plans import python_service_core_template_plan
 from src.utils.logger import success
-from src.utils.github import create_repo
 from src.utils.extension_manager import ExtensionManager
 from src.stack.profile import stack_registry
 from src.stack.types import TemplateConfig
@@ -62,6 +63,16 @@ class ServiceGenerator(BaseGenerator):
     extension_manager: ExtensionManager
     spec: ServiceSpec
 
+    # Language id -> structure method name. Looked up by name so the bound
+    # method (and any patch of it) is resolved at call time.
+    _LANGUAGE_STRUCTURES = {
+        "python": "_create_python_structure",
+        "rust": "_create_rust_structure",
+        "cpp": "_create_cpp_structure",
+        "go": "_create_go_structure",
+        "typescript": "_create_typescript_structure",
+    }
+
     def __init__(
         self,
         name: str,
@@ -161,9 +172,6 @@ class ServiceGenerator(BaseGenerator):
         # Configuration for the common create flow
         architecture_title: str = f"{self.name} Architecture Notes"
         success_message: str = f"{self.lang.title()} service '{self.name}' created successfully in '{self.project}'!"
-        def github_create_fn() -> bool | None:
-            return create_repo(self.name) if self.gh else None
-
         # Execute common create flow with service-specific setup
         self.execute_create_flow(
             directories=directories,
@@ -182,7 +190,7 @@ class ServiceGenerator(BaseGenerator):
             success_message=success_message,
             language_setup_fn=self._setup_service_specific,
             additional_setup_fn=self._setup_helm_if_requested,
-            github_create_fn=github_create_fn if self.gh else None
+            github_create_fn=self.github_create_fn()
         )
 
     def _validate_extension_selection(self) -> ServiceExtensionSelection:
@@ -226,9 +234,6 @@ class ServiceGenerator(BaseGenerator):
             "`docs/operations/README.md`, and `.kickstart/scaffold.json`."
         )
 
-        def github_create_fn() -> bool | None:
-            return create_repo(self.name) if self.gh else None
-
         self.execute_create_flow(
             directories=directories,
             template_plan=template_plan,
@@ -242,7 +247,7 @@ class ServiceGenerator(BaseGenerator):
                 lifecycle=self._cloudflare_worker_lifecycle(),
             ),
             success_message=success_message,
-            github_create_fn=github_create_fn if self.gh else None,
+            github_create_fn=self.github_create_fn(),
         )
 
     def _cloudflare_worker_template_configs(self) -> list[TemplatePathConfig]:
@@ -291,22 +296,11 @@ class ServiceGenerator(BaseGenerator):
             True if setup was successful, False otherwise
         """
         with safe_operation_context("Service-specific setup", log_errors=True):
-            # Write direct content
-            self.write_content(".env.example", "EXAMPLE_ENV_VAR=value\n")
-
-            # Language-specific files and structure
-            if self.lang == "python":
-                self._create_python_structure()
-            elif self.lang == "rust":
-                self._create_rust_structure()
-            elif self.lang == "cpp":
-                self._create_cpp_structure()
-            elif self.lang == "go":
-                self._create_go_structure()
-            elif self.lang == "typescript":
-                self._create_typescript_structure()
-            else:
+            # Each language structure writes its own .env.example once.
+            structure_method = self._LANGUAGE_STRUCTURES.get(self.lang)
+            if structure_method is None:
                 raise LanguageNotSupportedError(f"Unsupported language: {self.lang}")
+            getattr(self, structure_method)()
 
             return True
 
@@ -338,7 +332,7 @@ class ServiceGenerator(BaseGenerator):
         self.write_templates_from_plan(python_service_core_template_plan(self.framework))
         
         # Add extensions based on flags (only for FastAPI framework)
-        if self.framework != "minimal":
+        if self.framework != "minimal" and (self.database or self.cache or self.auth):
             self._add_python_extensions()
         
         self.write_content_files(
@@ -348,8 +342,6 @@ class ServiceGenerator(BaseGenerator):
                 framework=self.framework,
             )
         )
-        
-        self.create_directories(["migrations"])
 
     def _read_template_text(self, template_path: str) -> str:
         """Read source text from a scaffold template."""
@@ -373,12 +365,12 @@ class ServiceGenerator(BaseGenerator):
         if all_extension_requirements:
             extension_requirements = "\n\n# Extension requirements\n" + "\n".join(all_extension_requirements) + "\n"
 
-            # Read core requirements and append extensions
+            # Append to the core requirements in place; "r+" (unlike "a")
+            # still fails when the core file is missing.
             try:
-                with open(self.project / "requirements.txt", "r") as f:
-                    current_requirements = f.read()
-                enhanced_requirements = current_requirements + extension_requirements
-                self.write_content("requirements.txt", enhanced_requirements)
+                with (self.project / "requirements.txt").open("r+", encoding="utf-8") as f:
+                    f.seek(0, os.SEEK_END)
+                    f.write(extension_requirements)
             except FileNotFoundError:
                 # If core requirements don't exist, create with extensions only
                 self.write_content("requirements.txt", "\n".join(all_extension_requirements))
@@ -394,7 +386,6 @@ class ServiceGenerator(BaseGenerator):
 
         # Log what was added
         if extensions_added:
-            from src.utils.logger import success
             success(f"Extensions added: {', '.join(extensions_added)}")
 
     def _create_rust_structure(self) -> None:
@@ -419,13 +410,12 @@ class ServiceGenerator(BaseGenerator):
         if include_jwt_auth:
             self.write_template("src/handler/auth.rs", "rust/extensions/auth/jwt.rs.tpl")
 
-        if include_redis_cache or include_jwt_auth:
-            env_content = "EXAMPLE_ENV_VAR=value\n"
-            if include_redis_cache:
-                env_content += "REDIS_URL=redis://127.0.0.1:6379/0\n"
-            if include_jwt_auth:
-                env_content += f"JWT_SECRET=change-me-change-me\nJWT_ISSUER={self.name}\n"
-            self.write_content(".env.example", env_content)
+        env_content = DEFAULT_ENV_EXAMPLE_CONTENT
+        if include_redis_cache:
+            env_content += "REDIS_URL=redis://127.0.0.1:6379/0\n"
+        if include_jwt_auth:
+            env_content += f"JWT_SECRET=change-me-change-me\nJWT_ISSUER={self.name}\n"
+        self.write_content(".env.example", env_content)
 
         cargo_vars: dict[str, str] = {}
         if include_redis_cache:
@@ -468,7 +458,6 @@ class ServiceGenerator(BaseGenerator):
         if include_postgres_database:
             self.write_template("src/clients/database.ts", "typescript/src/clients/database.ts.tpl")
             self.write_template("package.json", "typescript/package.json.tpl", database="postgres")
-            self.create_directories(["migrations"])
             self.write_template("migrations/001_initial.sql", "typescript/extensions/database/migrations.sql.tpl")
 
     def _create_helm_chart(self) -> None:
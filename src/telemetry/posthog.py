@@ -3,8 +3,6 @@
 from dataclasses import dataclass, field
 from typing import Protocol
 
-import requests
-
 from src.model.dto.posthog import PostHogCapturePayload, PostHogCaptureRequest
 from src.model.dto.telemetry import TelemetryEnvelope
 from src.telemetry.config import PostHogSettings
@@ -18,9 +16,15 @@ class PostHogTransport(Protocol):
 
 
 class RequestsPostHogTransport:
-    """Issue exactly one blocking HTTP request with no transport retries."""
+    """Issue exactly one blocking HTTP request with no transport retries.
+
+    ``requests`` is imported on first send: every CLI command imports the
+    telemetry stack, but only enabled, configured delivery needs HTTP.
+    """
 
     def send(self, endpoint: str, payload: PostHogCapturePayload, timeout_seconds: float) -> None:
+        import requests
+
         response = requests.post(endpoint, json=payload, timeout=timeout_seconds, allow_redirects=False)
         if 300 <= response.status_code < 400:
             raise requests.HTTPError("PostHog capture endpoint redirected", response=response)
@@ -4,6 +4,21 @@ from typing import cast
 
 from src.utils.types import ConfigValue
 
+# Parsed config files keyed by path; an entry is reused only while the file's
+# (mtime_ns, size) stamp is unchanged, so edits are picked up on the next call.
+_cache: dict[Path, tuple[tuple[int, int], dict[str, ConfigValue]]] = {}
+
+
+def _load_file(path: Path) -> dict[str, ConfigValue]:
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    parsed = cast(dict[str, ConfigValue], toml.load(path))
+    _cache[path] = (stamp, parsed)
+    return parsed
+
 
 def load_config() -> dict[str, ConfigValue]:
     config: dict[str, ConfigValue] = {}
@@ -14,5 +29,5 @@ def load_config() -> dict[str, ConfigValue]:
     ]
     for path in paths:
         if path.exists():
-            config.update(cast(dict[str, ConfigValue], toml.load(path)))
+            config.update(_load_file(path))
     return config
@@ -7,7 +7,7 @@ exception types themselves live in `src.utils.errors`.
 
 import logging
 import functools
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Collection, Generator, Sequence
 from contextlib import contextmanager
 from pathlib import Path
 from typing import ParamSpec, TypeVar
@@ -68,9 +68,9 @@ def error_context(operation: str, **context: ErrorContextValue) -> Generator[Non
         KickstartError: Re-raises any exception as KickstartError with context
     """
     try:
-        logger.debug(f"Starting operation: {operation}")
+        logger.debug("Starting operation: %s", operation)
         yield
-        logger.debug(f"Completed operation: {operation}")
+        logger.debug("Completed operation: %s", operation)
     except KickstartError:
         # Re-raise KickstartError as-is
         raise
@@ -265,9 +265,9 @@ def safe_operation_context(
         None
     """
     try:
-        logger.debug(f"Starting safe operation: {operation_name}")
+        logger.debug("Starting safe operation: %s", operation_name)
         yield
-        logger.debug(f"Completed safe operation: {operation_name}")
+        logger.debug("Completed safe operation: %s", operation_name)
     except Exception as e:
         if log_errors:
             logger.error(f"Safe operation '{operation_name}' failed: {e}", exc_info=True)
@@ -393,7 +393,7 @@ def log_operation_result(
     target_str = f" for '{target}'" if target else ""
 
     if success:
-        logger.debug(f"{operation} succeeded{target_str}")
+        logger.debug("%s succeeded%s", operation, target_str)
     else:
         resolved_error = error or Exception("Unknown error")
         error_msg = format_error_message(operation, target or "unknown", resolved_error, context)
@@ -426,7 +426,7 @@ def batch_operation_wrapper(
         try:
             if operation_func(item):
                 collector.increment_success()
-                logger.debug(f"[{operation_name}] Success: {item_name}")
+                logger.debug("[%s] Success: %s", operation_name, item_name)
             else:
                 collector.add_error(f"Operation failed for {item_name}")
         except Exception as e:
@@ -437,19 +437,20 @@ def batch_operation_wrapper(
 
 
 # Common Error Patterns
-def validate_language_support(language: str, supported_languages: Sequence[str]) -> None:
+def validate_language_support(language: str, supported_languages: Collection[str]) -> None:
     """Validate that a language is supported.
 
     Args:
         language: The language to validate
-        supported_languages: List of supported languages
+        supported_languages: Supported languages; pass a set or frozenset for
+            hashed membership
 
     Raises:
         LanguageNotSupportedError: If language is not supported
     """
     if language not in supported_languages:
         raise LanguageNotSupportedError(
-            f"Language '{language}' is not supported. Supported languages: {', '.join(supported_languages)}"
+            f"Language '{language}' is not supported. Supported languages: {', '.join(sorted(supported_languages))}"
         )
 
 
@@ -474,7 +475,7 @@ def ensure_directory_exists(directory: Path, create: bool = True) -> bool:
 
     try:
         directory.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Created directory: {directory}")
+        logger.debug("Created directory: %s", directory)
         return True
     except OSError as e:
         raise DirectoryCreationError(f"Failed to create directory '{directory}': {e}") from e
@@ -509,7 +510,7 @@ def safe_binary_write(
         if permissions is not None:
             file_path.chmod(permissions)
 
-        logger.debug(f"Successfully wrote binary file: {file_path}")
+        logger.debug("Successfully wrote binary file: %s", file_path)
         return True
     except OSError as e:
         raise FileOperationError(f"Failed to write binary file '{file_path}': {e}") from e
@@ -540,7 +541,7 @@ def safe_file_write(
             ensure_directory_exists(file_path.parent)
 
         file_path.write_text(content, encoding=encoding)
-        logger.debug(f"Successfully wrote file: {file_path}")
+        logger.debug("Successfully wrote file: %s", file_path)
         return True
     except OSError as e:
         raise FileOperationError(f"Failed to write file '{file_path}': {e}") from e
@@ -577,7 +578,7 @@ def safe_file_copy(
         else:
             shutil.copy(source_path, target_path)
 
-        logger.debug(f"Successfully copied file: {source_path} -> {target_path}")
+        logger.debug("Successfully copied file: %s -> %s", source_path, target_path)
         return True
     except (OSError, shutil.Error) as e:
         raise FileOperationError(f"Failed to copy file '{source_path}' to '{target_path}': {e}") from e
@@ -85,22 +85,32 @@ class Extension:
         requirements_file = writer.template_dir / self.config.requirements_file
 
         try:
-            with open(requirements_file, "r") as f:
-                content = f.read()
-
-            # Parse requirements from template, filtering out comments and empty lines
-            requirements = []
-            for line in content.split("\n"):
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    requirements.append(line)
-
-            return requirements
+            return list(_parse_requirements_file(requirements_file))
         except FileNotFoundError:
             logger.warning(f"Requirements file not found: {requirements_file}")
             return []
 
 
+# Parsed requirement lines keyed by template path. Bundled templates do not
+# change while kickstart runs; missing files are not cached.
+_requirements_cache: dict[Path, tuple[str, ...]] = {}
+
+
+def _parse_requirements_file(requirements_file: Path) -> tuple[str, ...]:
+    """Return requirement lines from a template, skipping comments and blanks.
+
+    Raises:
+        FileNotFoundError: If the requirements template does not exist
+    """
+    requirements = _requirements_cache.get(requirements_file)
+    if requirements is None:
+        content = requirements_file.read_text(encoding="utf-8")
+        stripped = (line.strip() for line in content.splitlines())
+        requirements = tuple(line for line in stripped if line and not line.startswith("#"))
+        _requirements_cache[requirements_file] = requirements
+    return requirements
+
+
 class DatabaseExtension(Extension):
     """Database extension marker."""
 
@@ -137,7 +147,6 @@ class ExtensionManager:
                 TemplateConfig("migrations/001_initial.sql", "python/extensions/database/migrations.sql.tpl"),
             ),
             requirements_file="python/extensions/database/requirements.txt.tpl",
-            directories=("migrations",),
         )
         self._register_extension(DatabaseExtension(postgres_config))
 
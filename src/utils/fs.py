@@ -1,5 +1,6 @@
 from pathlib import Path
 import logging
+import re
 from jinja2 import Environment, FileSystemLoader, DictLoader, Template
 from jinja2.exceptions import TemplateError as Jinja2TemplateError, TemplateNotFound
 from src.utils.errors import TemplateError
@@ -8,6 +9,9 @@ from src.utils.types import MutableRenderVars, RenderValue, RenderVars
 
 logger = logging.getLogger(__name__)
 
+_NON_IDENTIFIER_CHARS = re.compile(r'[^a-zA-Z0-9]')
+_LEGACY_PLACEHOLDER = re.compile(r'\{\{(\w+)\}\}')
+
 
 class TemplateEngine:
     """High-performance Jinja2 template engine with caching and error handling."""
@@ -57,9 +61,8 @@ class TemplateEngine:
         Returns:
             Valid Python class name
         """
-        import re
         # Remove invalid characters and split on word boundaries
-        clean_name = re.sub(r'[^a-zA-Z0-9]', ' ', str(value))
+        clean_name = _NON_IDENTIFIER_CHARS.sub(' ', str(value))
         # Split into words and capitalize each
         words = [word.capitalize() for word in clean_name.split() if word]
         # Join words together
@@ -133,6 +136,22 @@ def get_template_engine() -> TemplateEngine:
     return _template_engine
 
 
+# File template engines keyed by template base directory. Reusing one
+# Environment per base keeps Jinja's compiled-template cache (including shared
+# parents and includes) alive across writes; its auto_reload check still
+# recompiles a template whose source changes.
+_file_template_engines: dict[Path, TemplateEngine] = {}
+
+
+def get_file_template_engine(template_base_dir: Path) -> TemplateEngine:
+    """Get the shared template engine for a template base directory."""
+    engine = _file_template_engines.get(template_base_dir)
+    if engine is None:
+        engine = TemplateEngine([template_base_dir])
+        _file_template_engines[template_base_dir] = engine
+    return engine
+
+
 def write_file(path: Path, template: Path | str, **vars: RenderValue) -> None:
     """Write a template file to the specified path with variable substitution.
 
@@ -165,12 +184,12 @@ def write_file(path: Path, template: Path | str, **vars: RenderValue) -> None:
             try:
                 # Set up template engine with correct template directories for inheritance
                 template_base_dir = _find_template_base_dir(template)
-                engine = TemplateEngine([template_base_dir])
+                engine = get_file_template_engine(template_base_dir)
 
                 # Get relative template path for Jinja2
                 relative_path = template.relative_to(template_base_dir)
                 content = engine.render_template(str(relative_path), render_vars)
-                logger.debug(f"Successfully rendered Jinja2 template: {template}")
+                logger.debug("Successfully rendered Jinja2 template: %s", template)
             except (TemplateError, FileNotFoundError) as e:
                 # Fallback to legacy placeholder replacement. Surface it to
                 # the user: the generator's own render path raises on the
@@ -180,6 +199,11 @@ def write_file(path: Path, template: Path | str, **vars: RenderValue) -> None:
                 logger.warning(f"Jinja2 templating failed for {template}, falling back to legacy: {e}")
                 content = template.read_text(encoding='utf-8')
                 content = _legacy_replace(content, render_vars)
+        elif "{" not in template and "\r" not in template:
+            # Static content (empty package markers, stub sources) has no Jinja
+            # delimiters, so rendering would return it unchanged; skip
+            # compiling a throwaway template for each one.
+            content = template
         else:
             # Template content as string
             try:
@@ -195,7 +219,7 @@ def write_file(path: Path, template: Path | str, **vars: RenderValue) -> None:
 
         # Write the rendered content
         path.write_text(content, encoding='utf-8')
-        logger.debug(f"Successfully wrote file: {path}")
+        logger.debug("Successfully wrote file: %s", path)
 
     except OSError as e:
         logger.error(f"Failed to write file {path}: {e}")
@@ -237,11 +261,17 @@ def _legacy_replace(content: str, variables: RenderVars) -> str:
     Returns:
         Content with placeholders replaced
     """
+    # Support both uppercase and original case; the first variable to claim a
+    # placeholder name wins, matching the old per-key replace order.
+    replacements: dict[str, str] = {}
     for key, value in variables.items():
-        # Support both uppercase and original case
-        content = content.replace(f"{{{{{key.upper()}}}}}", str(value))
-        content = content.replace(f"{{{{{key}}}}}", str(value))
-    return content
+        replacements.setdefault(str(key).upper(), str(value))
+        replacements.setdefault(str(key), str(value))
+
+    def _substitute(match: re.Match[str]) -> str:
+        return replacements.get(match.group(1), match.group(0))
+
+    return _LEGACY_PLACEHOLDER.sub(_substitute, content)
 
 
 def _with_legacy_variable_aliases(variables: RenderVars) -> MutableRenderVars:
@@ -274,7 +274,7 @@ def update_path_in_rc(rc_path: Path, snippet: str) -> bool:
     managed block per rc file, so re-running install is idempotent.
     """
     block = _format_managed_block(snippet)
-    existing = rc_path.read_text() if rc_path.exists() else None
+    existing = _read_text_if_present(rc_path)
 
     if existing is None:
         rc_path.parent.mkdir(parents=True, exist_ok=True)
@@ -295,16 +295,22 @@ def update_path_in_rc(rc_path: Path, snippet: str) -> bool:
 
 def remove_path_block_from_rc(rc_path: Path) -> bool:
     """Remove the managed PATH block from `rc_path`. Returns True when the file changed."""
-    if not rc_path.exists():
-        return False
-    existing = rc_path.read_text()
-    if MARKER_BEGIN not in existing:
+    existing = _read_text_if_present(rc_path)
+    if existing is None or MARKER_BEGIN not in existing:
         return False
     cleanup_re = re.compile(rf"\n?{_MANAGED_BLOCK_RE.pattern}", _MANAGED_BLOCK_RE.flags)
     rc_path.write_text(cleanup_re.sub("\n", existing, count=1).lstrip("\n"))
     return True
 
 
+def _read_text_if_present(path: Path) -> str | None:
+    """Read `path` in one open, returning None when it does not exist."""
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return None
+
+
 def _format_managed_block(snippet: str) -> str:
     """Render the full ``MARKER_BEGIN / snippet / MARKER_END`` block, newline-terminated."""
     return "\n".join([MARKER_BEGIN, snippet, MARKER_END]) + "\n"
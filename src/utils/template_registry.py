@@ -9,6 +9,7 @@ from typing import Mapping
 from dataclasses import dataclass
 import logging
 from src.stack.profile import stack_registry
+from src.utils.errors import TemplateError
 from src.utils.types import TemplatePathConfig, TemplateValue
 
 logger = logging.getLogger(__name__)
@@ -122,6 +123,9 @@ class TemplateRegistry:
         self._templates: dict[str, TemplateInfo] = {}
         self._language_templates: dict[str, dict[str, TemplateInfo]] = {}
         self._project_templates: dict[str, dict[str, TemplateInfo]] = {}
+        self._resolved_files: dict[tuple[Path, str], Path] = {}
+        # (template dir mtime_ns, languages); cleared by register_template.
+        self._available_languages: tuple[int | None, list[str]] | None = None
         self._initialize_default_templates()
     
     def _initialize_default_templates(self) -> None:
@@ -178,6 +182,7 @@ class TemplateRegistry:
             template: Template information to register
         """
         self._templates[template.name] = template
+        self._available_languages = None
         
         if template.language:
             if template.language not in self._language_templates:
@@ -262,6 +267,33 @@ class TemplateRegistry:
         resolved_path = template.path.format(**context)
         return self.base_template_dir / resolved_path
     
+    def resolve_template_file(self, template_dir: Path, template_path: str) -> Path:
+        """Resolve a generator-relative template path to an existing file.
+        
+        ``_shared/`` paths resolve against the registry's base directory and
+        all others against ``template_dir``. Bundled templates do not change
+        while kickstart runs, so hits are cached; misses are not.
+        
+        Args:
+            template_dir: The calling generator's template directory
+            template_path: Template path relative to that directory
+            
+        Returns:
+            Absolute path to the template file
+            
+        Raises:
+            TemplateError: If the template file does not exist
+        """
+        key = (template_dir, template_path)
+        resolved = self._resolved_files.get(key)
+        if resolved is None:
+            base_dir = self.base_template_dir if template_path.startswith("_shared/") else template_dir
+            resolved = base_dir / template_path
+            if not resolved.exists():
+                raise TemplateError(f"Template file not found: {template_path}")
+            self._resolved_files[key] = resolved
+        return resolved
+    
     def validate_template_variables(self, template: TemplateInfo, variables: Mapping[str, TemplateValue]) -> list[str]:
         """Validate that all required template variables are provided.
         
@@ -294,15 +326,27 @@ class TemplateRegistry:
         Returns:
             List of language identifiers
         """
+        try:
+            dir_mtime: int | None = self.base_template_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            dir_mtime = None
+
+        # Adding or removing a template directory bumps the parent's mtime,
+        # so the directory walk only reruns when the listing can differ.
+        if self._available_languages is not None and self._available_languages[0] == dir_mtime:
+            return list(self._available_languages[1])
+
         languages = set(self._language_templates.keys())
         
         # Also check for template directories
-        if self.base_template_dir.exists():
+        if dir_mtime is not None:
             for item in self.base_template_dir.iterdir():
                 if item.is_dir() and not item.name.startswith('.'):
                     languages.add(item.name)
         
-        return sorted(list(languages))
+        available = sorted(languages)
+        self._available_languages = (dir_mtime, available)
+        return list(available)
 
 
 # Global registry instance
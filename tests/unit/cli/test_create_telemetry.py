@@ -114,7 +114,8 @@ def test_missing_name_marks_partial_argument_prompt_flow_interactive() -> None:
     runner = CliRunner()
     with (
         patch("src.cli.main.load_config", return_value={}),
-        patch("src.cli.main.Prompt.ask", side_effect=["none", "none", "none", "fastapi"]),
+        patch("src.cli.prompts._stdin_is_tty", return_value=True),
+        patch("rich.prompt.Prompt.ask", side_effect=["none", "none", "none", "fastapi"]),
         patch("src.cli.main.capture_scaffold_create_terminal") as capture,
     ):
         result = runner.invoke(app, ["create", "service"])
@@ -0,0 +1,108 @@
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import typer.main
+
+from src import __version__
+from src.cli.entry import COMMAND_SUMMARIES, main
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.mark.parametrize("argv", [["version"], ["--version"]])
+def test_version_args_print_version(argv, capsys):
+    with patch("src.cli.main.app") as app:
+        main(argv)
+
+    assert capsys.readouterr().out == f"kickstart v{__version__}\n"
+    app.assert_not_called()
+
+
+def test_version_fast_path_does_not_import_typer_or_rich():
+    probe = (
+        "import sys\n"
+        "from src.cli.entry import main\n"
+        "main(['version'])\n"
+        "assert 'typer' not in sys.modules, 'typer imported'\n"
+        "assert 'rich' not in sys.modules, 'rich imported'\n"
+        "assert 'src.cli.main' not in sys.modules, 'command modules imported'\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == f"kickstart v{__version__}\n"
+
+
+@pytest.mark.parametrize("argv", [[], ["-h"], ["--help"]])
+def test_help_args_print_static_help(argv, capsys):
+    with patch("src.cli.main.app") as app:
+        main(argv)
+
+    out = capsys.readouterr().out
+    assert out.startswith("Usage: kickstart [OPTIONS] COMMAND [ARGS]...")
+    for name, summary in COMMAND_SUMMARIES:
+        assert f"  {name}" in out
+        assert summary in out
+    app.assert_not_called()
+
+
+def test_static_help_matches_registered_commands():
+    from src.cli.main import app
+
+    commands = typer.main.get_command(app).commands
+    registered = tuple(
+        (name, command.get_short_help_str(limit=200)) for name, command in commands.items()
+    )
+
+    assert COMMAND_SUMMARIES == registered
+
+
+def test_help_fast_path_does_not_import_typer():
+    probe = (
+        "import sys\n"
+        "from src.cli.entry import main\n"
+        "main([])\n"
+        "assert 'typer' not in sys.modules, 'typer imported'\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_other_args_run_typer_app():
+    with patch("src.cli.main.app") as app:
+        main(["create", "service", "demo"])
+
+    app.assert_called_once_with(args=["create", "service", "demo"], prog_name="kickstart")
+
+
+def test_importing_command_modules_does_not_import_requests():
+    probe = (
+        "import sys\n"
+        "import src.cli.main\n"
+        "assert 'requests' not in sys.modules, 'requests imported'\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
@@ -1,6 +1,15 @@
 from typer.testing import CliRunner
 from src.cli.main import app
 import src.cli.main as cli_main
+from src.cli.options import CreateCommandOptions
+from src.cli.prompts import (
+    PlainConfirm,
+    PlainPrompt,
+    RichConfirm,
+    RichPrompt,
+    prompt_for_missing_args,
+    prompt_readers,
+)
 
 
 def test_interactive_create_service(tmp_path, monkeypatch):
@@ -20,3 +29,47 @@ def test_interactive_create_service(tmp_path, monkeypatch):
     assert result.exit_code == 0
     assert recorded['name'] == 'my-svc'
     assert recorded['root'] == str(tmp_path)
+
+
+def test_plain_prompt_reasks_until_choice_is_valid(monkeypatch, capsys):
+    answers = iter(["redis", "postgres"])
+    monkeypatch.setattr("builtins.input", lambda _prompt: next(answers))
+
+    value = PlainPrompt().ask("Database extension", choices=["none", "postgres"], default="none")
+
+    assert value == "postgres"
+    assert "Please select one of the available options" in capsys.readouterr().out
+
+
+def test_plain_readers_fall_back_to_defaults(monkeypatch):
+    monkeypatch.setattr("builtins.input", lambda _prompt: "")
+
+    assert PlainPrompt().ask("Language", default="python") == "python"
+    assert PlainConfirm().ask("Create GitHub repo?", default=True) is True
+
+
+def test_prompt_readers_use_plain_input_without_a_terminal(monkeypatch):
+    monkeypatch.setattr("src.cli.prompts._stdin_is_tty", lambda: False)
+    prompt, confirm = prompt_readers()
+    assert isinstance(prompt, PlainPrompt)
+    assert isinstance(confirm, PlainConfirm)
+
+    monkeypatch.setattr("src.cli.prompts._stdin_is_tty", lambda: True)
+    prompt, confirm = prompt_readers()
+    assert isinstance(prompt, RichPrompt)
+    assert isinstance(confirm, RichConfirm)
+
+
+def test_fully_specified_options_never_prompt():
+    class NoPrompt:
+        def ask(self, *args, **kwargs):
+            raise AssertionError("prompted for a fully specified command")
+
+    options = prompt_for_missing_args(
+        CreateCommandOptions(project_type="service", name="api", root=None, lang="python", gh=False, helm=False),
+        {},
+        prompt=NoPrompt(),
+        confirm=NoPrompt(),
+    )
+
+    assert (options.project_type, options.name, options.database) == ("service", "api", None)
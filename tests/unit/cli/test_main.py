@@ -29,6 +29,13 @@ def runner():
     return CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def terminal_stdin():
+    """Exercise the Rich prompt readers; CliRunner's stdin is never a TTY."""
+    with patch('src.cli.prompts._stdin_is_tty', return_value=True):
+        yield
+
+
 @pytest.fixture
 def mock_config():
     return {"default_language": "python", "github_token": "test-token"}
@@ -44,7 +51,7 @@ def test_version_command(runner):
 
 
 @patch("src.cli.main.capture_cli_upgrade_terminal")
-@patch("src.cli.main.check_for_update")
+@patch("src.utils.updater.check_for_update")
 def test_upgrade_command(mock_check_for_update, mock_capture, runner):
     """Test the upgrade command calls check_for_update."""
     update_result = UpgradeResult(
@@ -71,7 +78,7 @@ def test_upgrade_command(mock_check_for_update, mock_capture, runner):
 )
 def test_upgrade_captures_unhandled_terminal_outcomes(error, outcome, category):
     with (
-        patch("src.cli.main.check_for_update", side_effect=error),
+        patch("src.utils.updater.check_for_update", side_effect=error),
         patch("src.cli.main.capture_cli_upgrade_terminal") as capture,
         pytest.raises(type(error)),
     ):
@@ -317,8 +324,8 @@ def test_create_system_with_bun_turbo_workspace_tooling(mock_load_config, mock_c
 
 @patch('src.cli.main.create_service')
 @patch('src.cli.main.load_config')
-@patch('src.cli.main.Confirm')
-@patch('src.cli.main.Prompt')
+@patch('rich.prompt.Confirm')
+@patch('rich.prompt.Prompt')
 def test_create_interactive_service(mock_prompt, mock_confirm, mock_load_config, mock_create_service, runner, mock_config):
     """Test creating a service interactively."""
     mock_load_config.return_value = mock_config
@@ -335,8 +342,28 @@ def test_create_interactive_service(mock_prompt, mock_confirm, mock_load_config,
 
 @patch('src.cli.main.create_service')
 @patch('src.cli.main.load_config')
-@patch('src.cli.main.Confirm')
-@patch('src.cli.main.Prompt')
+@patch('rich.prompt.Confirm')
+@patch('rich.prompt.Prompt')
+def test_create_interactive_skips_confirms_answered_by_flags(
+    mock_prompt, mock_confirm, mock_load_config, mock_create_service, runner, mock_config
+):
+    """--gh and --helm passed to the wizard are not asked again."""
+    mock_load_config.return_value = mock_config
+    mock_prompt.ask.side_effect = ["service", "my-service", "/tmp", "rust", "none", "none"]
+
+    result = runner.invoke(app, ["create", "--gh", "--helm"])
+
+    assert result.exit_code == 0
+    mock_confirm.ask.assert_not_called()
+    mock_create_service.assert_called_once_with(
+        "my-service", "rust", True, mock_config, helm=True, root="/tmp"
+    )
+
+
+@patch('src.cli.main.create_service')
+@patch('src.cli.main.load_config')
+@patch('rich.prompt.Confirm')
+@patch('rich.prompt.Prompt')
 def test_create_interactive_rust_service_can_select_jwt(
     mock_prompt,
     mock_confirm,
@@ -360,8 +387,8 @@ def test_create_interactive_rust_service_can_select_jwt(
 
 @patch('src.cli.main.create_service')
 @patch('src.cli.main.load_config')
-@patch('src.cli.main.Confirm')
-@patch('src.cli.main.Prompt')
+@patch('rich.prompt.Confirm')
+@patch('rich.prompt.Prompt')
 def test_create_interactive_typescript_service_can_select_postgres(
     mock_prompt,
     mock_confirm,
@@ -385,8 +412,8 @@ def test_create_interactive_typescript_service_can_select_postgres(
 
 @patch('src.cli.main.create_frontend')
 @patch('src.cli.main.load_config')
-@patch('src.cli.main.Confirm')
-@patch('src.cli.main.Prompt')
+@patch('rich.prompt.Confirm')
+@patch('rich.prompt.Prompt')
 def test_create_interactive_frontend(mock_prompt, mock_confirm, mock_load_config, mock_create_frontend, runner, mock_config):
     """Test creating a frontend interactively."""
     mock_load_config.return_value = mock_config
@@ -403,8 +430,8 @@ def test_create_interactive_frontend(mock_prompt, mock_confirm, mock_load_config
 
 @patch('src.cli.main.create_lib')
 @patch('src.cli.main.load_config')
-@patch('src.cli.main.Confirm')
-@patch('src.cli.main.Prompt')
+@patch('rich.prompt.Confirm')
+@patch('rich.prompt.Prompt')
 def test_create_interactive_lib(mock_prompt, mock_confirm, mock_load_config, mock_create_lib, runner, mock_config):
     """Test creating a library interactively."""
     mock_load_config.return_value = mock_config
@@ -421,8 +448,8 @@ def test_create_interactive_lib(mock_prompt, mock_confirm, mock_load_config, moc
 
 @patch('src.cli.main.create_cli')
 @patch('src.cli.main.load_config')
-@patch('src.cli.main.Confirm')
-@patch('src.cli.main.Prompt')
+@patch('rich.prompt.Confirm')
+@patch('rich.prompt.Prompt')
 def test_create_interactive_cli(mock_prompt, mock_confirm, mock_load_config, mock_create_cli, runner, mock_config):
     """Test creating a CLI interactively."""
     mock_load_config.return_value = mock_config
@@ -439,8 +466,8 @@ def test_create_interactive_cli(mock_prompt, mock_confirm, mock_load_config, moc
 
 @patch('src.cli.main.create_monorepo')
 @patch('src.cli.main.load_config')
-@patch('src.cli.main.Confirm')
-@patch('src.cli.main.Prompt')
+@patch('rich.prompt.Confirm')
+@patch('rich.prompt.Prompt')
 def test_create_interactive_monorepo(mock_prompt, mock_confirm, mock_load_config, mock_create_monorepo, runner, mock_config):
     """Test creating a monorepo interactively."""
     mock_load_config.return_value = mock_config
@@ -467,7 +494,7 @@ def test_create_unsupported_type(mock_load_config, runner, mock_config):
 
 
 @patch('src.cli.main.load_config') 
-@patch('src.cli.main.Prompt')
+@patch('rich.prompt.Prompt')
 def test_create_defaults_root_to_cwd_without_prompting(mock_prompt, mock_load_config, runner, mock_config):
     """A fully specified create must not ambush automation with a root prompt."""
     mock_load_config.return_value = mock_config
@@ -485,8 +512,8 @@ def test_create_defaults_root_to_cwd_without_prompting(mock_prompt, mock_load_co
 def test_helm_option_only_for_service_and_mono():
     """Test that helm option is only prompted for service and mono project types."""
     with patch('src.cli.main.load_config') as mock_load_config, \
-         patch('src.cli.main.Prompt') as mock_prompt, \
-         patch('src.cli.main.Confirm') as mock_confirm, \
+         patch('rich.prompt.Prompt') as mock_prompt, \
+         patch('rich.prompt.Confirm') as mock_confirm, \
          patch('src.cli.main.create_frontend'):
         
         mock_load_config.return_value = {"default_language": "python"}
@@ -502,8 +529,8 @@ def test_helm_option_only_for_service_and_mono():
 
 
 @patch('src.cli.main.load_config')
-@patch('src.cli.main.Prompt')
-@patch('src.cli.main.Confirm')
+@patch('rich.prompt.Prompt')
+@patch('rich.prompt.Confirm')
 def test_interactive_helm_prompt_for_service(mock_confirm, mock_prompt, mock_load_config, runner):
     """Test that helm is prompted for service type in interactive mode."""
     mock_load_config.return_value = {"default_language": "python"}
@@ -522,8 +549,8 @@ def test_interactive_helm_prompt_for_service(mock_confirm, mock_prompt, mock_loa
 
 
 @patch('src.cli.main.load_config')
-@patch('src.cli.main.Prompt')
-@patch('src.cli.main.Confirm')
+@patch('rich.prompt.Prompt')
+@patch('rich.prompt.Confirm')
 def test_interactive_helm_prompt_for_mono(mock_confirm, mock_prompt, mock_load_config, runner):
     """Test that helm is prompted for mono type in interactive mode."""
     mock_load_config.return_value = {"default_language": "python"}
@@ -558,13 +585,13 @@ def test_default_values():
 
 
 @patch('src.cli.main.load_config')
-@patch('src.cli.main.Prompt')
+@patch('rich.prompt.Prompt')
 def test_config_default_language_used_in_interactive(mock_prompt, mock_load_config, runner):
     """Test that config default language is used in interactive mode."""
     mock_load_config.return_value = {"default_language": "rust"}
     mock_prompt.ask.side_effect = ["lib", "test-lib", "/tmp", "rust"]  # Last rust is the prompted default
     
-    with patch('src.cli.main.Confirm') as mock_confirm, \
+    with patch('rich.prompt.Confirm') as mock_confirm, \
          patch('src.cli.main.create_lib'):
         
         mock_confirm.ask.return_value = False
@@ -604,7 +631,7 @@ def test_create_service_exception_propagation(mock_load_config, mock_create_serv
     mock_create_service.side_effect = ValueError("Test error")
     
     # This test should use root prompt, so mock it
-    with patch('src.cli.main.Prompt') as mock_prompt:
+    with patch('rich.prompt.Prompt') as mock_prompt:
         mock_prompt.ask.return_value = "/tmp"
         result = runner.invoke(app, ["create", "service", "test"])
     
@@ -1102,3 +1129,9 @@ def test_install_context_dataclass_is_frozen():
     )
     with pytest.raises(Exception):
         ctx.install_dir = Path("/tmp/y")  # type: ignore[misc]
+
+
+def test_dispatch_table_covers_every_known_project_type():
+    from src.cli.dispatch import _PROJECT_DISPATCH, KNOWN_PROJECT_TYPES
+
+    assert set(_PROJECT_DISPATCH) == KNOWN_PROJECT_TYPES
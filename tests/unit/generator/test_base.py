@@ -1,3 +1,4 @@
+import os
 import pytest
 from pathlib import Path
 import json
@@ -39,6 +40,22 @@ def test_create_directories(base_generator, tmp_path):
         assert (tmp_path / "dir1").exists()
         assert (tmp_path / "dir2/subdir").exists()
 
+def test_create_directories_skips_mkdir_for_ancestors_of_other_targets(base_generator, tmp_path):
+    with patch.object(base_generator, 'project', tmp_path), \
+         patch.object(Path, 'mkdir', autospec=True,
+                      side_effect=lambda path, **kwargs: os.makedirs(path, exist_ok=True)) as mkdir:
+        assert base_generator.create_directories(["src", "src/api", "src/api", "docs"]) is True
+
+    created = [call.args[0] for call in mkdir.call_args_list]
+    assert created == [tmp_path / "docs", tmp_path / "src/api"]
+    assert (tmp_path / "src").is_dir()
+
+def test_create_directories_reports_failure(base_generator, tmp_path):
+    (tmp_path / "taken").write_text("not a directory")
+    with patch.object(base_generator, 'project', tmp_path):
+        assert base_generator.create_directories(["ok", "taken"]) is False
+    assert (tmp_path / "ok").is_dir()
+
 def test_init_basic_structure(base_generator, tmp_path):
     with patch.object(base_generator, 'project', tmp_path):
         base_generator.init_basic_structure(["foo", "bar"])
@@ -119,6 +136,20 @@ def test_write_template(mock_write_file, base_generator, tmp_path):
         name="World",
     )
 
+def test_write_templates_from_plan_reports_failed_entries(base_generator):
+    from src.generator.template_plan import TemplatePlan
+    from src.stack.types import TemplateConfig
+
+    plan = TemplatePlan.from_templates(
+        [TemplateConfig("a.txt", "a.tpl"), TemplateConfig("b.txt", "b.tpl", {"extra": "1"})],
+        {"shared": "x"},
+    )
+    with patch.object(base_generator, 'write_template', side_effect=[True, False]) as write_template:
+        assert base_generator.write_templates_from_plan(plan) is False
+
+    assert write_template.call_args_list[1].args == ("b.txt", "b.tpl")
+    assert write_template.call_args_list[1].kwargs == {"shared": "x", "extra": "1"}
+
 @patch('src.generator.base.write_file')
 def test_write_content(mock_write_file, base_generator):
     target = "output.txt"
@@ -141,3 +172,68 @@ def test_get_common_vars(base_generator):
     vars = base_generator.get_common_vars()
     assert vars == {"service_name": "test-project"} 
 
+
+
+def test_execute_create_flow_fails_when_a_setup_step_raises(base_generator, tmp_path):
+    from src.generator.template_plan import TemplatePlan
+    from src.utils.errors import ProjectCreationError
+
+    def broken_setup() -> bool:
+        raise OSError("disk full")
+
+    contract = ScaffoldContract(
+        project_kind="service",
+        execution_models=("container",),
+        runtime_platforms=("local",),
+        entrypoint="src/main.py",
+    )
+    github = []
+    with patch.object(base_generator, 'project', tmp_path / "new-project"), \
+         patch.object(base_generator, 'init_basic_structure', return_value=True), \
+         patch.object(base_generator, 'write_templates_from_plan', return_value=True), \
+         patch.object(base_generator, 'create_architecture_docs', return_value=True), \
+         patch.object(base_generator, 'create_scaffold_contract_docs', return_value=True):
+        with pytest.raises(ProjectCreationError, match="Language-specific setup failed"):
+            base_generator.execute_create_flow(
+                directories=["src"],
+                template_plan=TemplatePlan.from_templates([]),
+                architecture_title="Docs",
+                scaffold_contract=contract,
+                success_message="done",
+                language_setup_fn=broken_setup,
+                github_create_fn=lambda: github.append("created"),
+            )
+
+    assert github == []
+
+def test_github_create_fn_is_none_without_gh(base_generator):
+    assert base_generator.github_create_fn() is None
+
+@patch('src.utils.github.create_repo')
+def test_github_create_fn_creates_repo_named_after_project(mock_create_repo, base_generator):
+    base_generator.gh = True
+
+    step = base_generator.github_create_fn()
+    assert step is not None
+    step()
+
+    mock_create_repo.assert_called_once_with("test-project")
+
+def test_importing_generators_does_not_import_requests():
+    import subprocess
+    import sys
+
+    probe = (
+        "import sys\n"
+        "import src.generator.service, src.generator.lib, src.generator.frontend, src.generator.monorepo\n"
+        "assert 'requests' not in sys.modules, 'requests imported'\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=Path(__file__).resolve().parents[3],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
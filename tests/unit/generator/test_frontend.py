@@ -40,7 +40,7 @@ def test_frontend_generator_initialization_with_root(frontend_generator_with_roo
     assert frontend_generator_with_root.project == Path("/tmp/test-frontend")
 
 
-@patch('src.generator.frontend.create_repo')
+@patch('src.utils.github.create_repo')
 @patch.object(FrontendGenerator, 'write_template')
 @patch.object(FrontendGenerator, 'create_architecture_docs')
 @patch.object(FrontendGenerator, 'init_basic_structure')
@@ -83,7 +83,7 @@ def test_create_success_with_gh(
     mock_create_repo.assert_called_once_with("test-frontend")
 
 
-@patch('src.generator.frontend.create_repo')
+@patch('src.utils.github.create_repo')
 @patch.object(FrontendGenerator, 'write_template')
 @patch.object(FrontendGenerator, 'create_architecture_docs')
 @patch.object(FrontendGenerator, 'init_basic_structure')
@@ -236,7 +236,7 @@ def test_github_repo_creation_conditional():
              patch.object(FrontendGenerator, 'write_template'), \
              patch.object(FrontendGenerator, 'create_architecture_docs'), \
              patch.object(FrontendGenerator, 'log_success'), \
-             patch('src.generator.frontend.create_repo') as mock_create_repo:
+             patch('src.utils.github.create_repo') as mock_create_repo:
             
             generator = FrontendGenerator("test", gh_flag, {})
             generator.create()
@@ -76,7 +76,7 @@ def test_cli_generator_inherits_from_library_generator():
     assert cli_gen.gh is False
 
 
-@patch('src.generator.lib.create_repo')
+@patch('src.utils.github.create_repo')
 @patch.object(LibraryGenerator, 'write_content_files')
 @patch.object(LibraryGenerator, 'write_template')
 @patch.object(LibraryGenerator, 'create_architecture_docs')
@@ -117,7 +117,7 @@ def test_library_create_python_success_with_gh(
     mock_create_repo.assert_called_once_with("test-lib")
 
 
-@patch('src.generator.lib.create_repo')
+@patch('src.utils.github.create_repo')
 @patch.object(LibraryGenerator, 'write_content_files')
 @patch.object(LibraryGenerator, 'write_template')
 @patch.object(LibraryGenerator, 'create_architecture_docs')
@@ -162,7 +162,7 @@ def test_library_create_fails_when_create_project_fails(mock_create_project, lib
     mock_create_project.assert_called_once()
 
 
-@patch('src.generator.lib.create_repo')
+@patch('src.utils.github.create_repo')
 @patch.object(CLIGenerator, 'write_content')
 @patch.object(CLIGenerator, 'write_template')
 @patch.object(CLIGenerator, 'create_architecture_docs')
@@ -206,7 +206,7 @@ def test_cli_create_python_success_with_gh(
     mock_create_repo.assert_called_once_with("test-cli")
 
 
-@patch('src.generator.lib.create_repo')
+@patch('src.utils.github.create_repo')
 @patch.object(CLIGenerator, 'write_content')
 @patch.object(CLIGenerator, 'write_template')
 @patch.object(CLIGenerator, 'create_architecture_docs')
@@ -243,7 +243,7 @@ def test_cli_create_rust_success(
     mock_create_repo.assert_not_called()
 
 
-@patch('src.generator.lib.create_repo')
+@patch('src.utils.github.create_repo')
 @patch.object(CLIGenerator, 'write_content')
 @patch.object(CLIGenerator, 'write_template')
 @patch.object(CLIGenerator, 'create_architecture_docs')
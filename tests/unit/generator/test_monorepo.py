@@ -170,7 +170,7 @@ def test_monorepo_rejects_invalid_profile_options():
         MonorepoGenerator("test", False, {}, runtime="lambda").create()
 
 
-@patch('src.generator.monorepo.create_repo')
+@patch('src.utils.github.create_repo')
 @patch.object(MonorepoGenerator, '_create_kustomize_structure')
 @patch.object(MonorepoGenerator, 'write_template')
 @patch.object(MonorepoGenerator, 'create_architecture_docs')
@@ -224,7 +224,7 @@ def test_create_success_with_kustomize_and_gh(
     mock_create_repo.assert_called_once_with("test-monorepo")
 
 
-@patch('src.generator.monorepo.create_repo')
+@patch('src.utils.github.create_repo')
 @patch.object(MonorepoGenerator, '_create_helm_structure')
 @patch.object(MonorepoGenerator, 'write_template')
 @patch.object(MonorepoGenerator, 'create_architecture_docs')
@@ -335,6 +335,27 @@ def test_create_kustomize_structure(mock_create_directories, mock_write_template
         assert _template_written(mock_write_template, *expected_call.args)
 
 
+@patch.object(MonorepoGenerator, 'write_template')
+@patch.object(MonorepoGenerator, 'create_directories')
+def test_kustomize_overlays_render_with_their_environment(mock_create_directories, mock_write_template, monorepo_generator):
+    monorepo_generator._create_kustomize_structure()
+
+    environments = {
+        template_call.args[0]: template_call.kwargs["environment"]
+        for template_call in mock_write_template.call_args_list
+        if template_call.args[1] == "kustomize/overlay-kustomization.yaml"
+    }
+    assert environments == {
+        "infra/k8s/overlays/dev/kustomization.yaml": "dev",
+        "infra/k8s/overlays/staging/kustomization.yaml": "staging",
+        "infra/k8s/overlays/prod/kustomization.yaml": "prod",
+    }
+    assert all(
+        template_call.kwargs["system_name"] == monorepo_generator.name
+        for template_call in mock_write_template.call_args_list
+    )
+
+
 def test_terraform_environments_coverage():
     """Test that all expected environments are covered in terraform file generation."""
     expected_envs = ["dev", "staging", "prod"]
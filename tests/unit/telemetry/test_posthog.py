@@ -64,7 +64,7 @@ def test_requests_transport_posts_json_and_checks_response() -> None:
         },
     )
 
-    with patch("src.telemetry.posthog.requests.post", return_value=response) as post:
+    with patch("requests.post", return_value=response) as post:
         RequestsPostHogTransport().send("https://example.test/capture", payload, 1.5)
 
     post.assert_called_once_with("https://example.test/capture", json=payload, timeout=1.5, allow_redirects=False)
@@ -85,7 +85,7 @@ def test_requests_transport_rejects_redirect_without_following_it() -> None:
         },
     )
 
-    with patch("src.telemetry.posthog.requests.post", return_value=response) as post:
+    with patch("requests.post", return_value=response) as post:
         with pytest.raises(requests.HTTPError, match="redirected"):
             RequestsPostHogTransport().send("https://example.test/capture", payload, 1.5)
 
@@ -10,7 +10,7 @@ from src.api import (
 )
 
 
-@patch('src.api.ServiceGenerator')
+@patch('src.generator.service.ServiceGenerator')
 def test_create_service_basic(mock_service_generator):
     mock_generator_instance = MagicMock()
     mock_service_generator.return_value = mock_generator_instance
@@ -33,7 +33,7 @@ def test_create_service_basic(mock_service_generator):
     mock_generator_instance.create.assert_called_once()
 
 
-@patch('src.api.ServiceGenerator')
+@patch('src.generator.service.ServiceGenerator')
 def test_create_service_with_helm_and_root(mock_service_generator):
     mock_generator_instance = MagicMock()
     mock_service_generator.return_value = mock_generator_instance
@@ -56,7 +56,7 @@ def test_create_service_with_helm_and_root(mock_service_generator):
     mock_generator_instance.create.assert_called_once()
 
 
-@patch('src.api.ServiceGenerator')
+@patch('src.generator.service.ServiceGenerator')
 def test_create_service_with_keyword_only_args(mock_service_generator):
     mock_generator_instance = MagicMock()
     mock_service_generator.return_value = mock_generator_instance
@@ -69,7 +69,7 @@ def test_create_service_with_keyword_only_args(mock_service_generator):
     assert mock_service_generator.call_count == 3
 
 
-@patch('src.api.FrontendGenerator')
+@patch('src.generator.frontend.FrontendGenerator')
 def test_create_frontend_basic(mock_frontend_generator):
     mock_generator_instance = MagicMock()
     mock_frontend_generator.return_value = mock_generator_instance
@@ -80,7 +80,7 @@ def test_create_frontend_basic(mock_frontend_generator):
     mock_generator_instance.create.assert_called_once()
 
 
-@patch('src.api.FrontendGenerator')
+@patch('src.generator.frontend.FrontendGenerator')
 def test_create_frontend_with_root(mock_frontend_generator):
     mock_generator_instance = MagicMock()
     mock_frontend_generator.return_value = mock_generator_instance
@@ -91,7 +91,7 @@ def test_create_frontend_with_root(mock_frontend_generator):
     mock_generator_instance.create.assert_called_once()
 
 
-@patch('src.api.LibraryGenerator')
+@patch('src.generator.lib.LibraryGenerator')
 def test_create_lib_basic(mock_lib_generator):
     mock_generator_instance = MagicMock()
     mock_lib_generator.return_value = mock_generator_instance
@@ -102,7 +102,7 @@ def test_create_lib_basic(mock_lib_generator):
     mock_generator_instance.create.assert_called_once()
 
 
-@patch('src.api.LibraryGenerator')
+@patch('src.generator.lib.LibraryGenerator')
 def test_create_lib_with_root(mock_lib_generator):
     mock_generator_instance = MagicMock()
     mock_lib_generator.return_value = mock_generator_instance
@@ -113,7 +113,7 @@ def test_create_lib_with_root(mock_lib_generator):
     mock_generator_instance.create.assert_called_once()
 
 
-@patch('src.api.CLIGenerator')
+@patch('src.generator.lib.CLIGenerator')
 def test_create_cli_basic(mock_cli_generator):
     mock_generator_instance = MagicMock()
     mock_cli_generator.return_value = mock_generator_instance
@@ -124,7 +124,7 @@ def test_create_cli_basic(mock_cli_generator):
     mock_generator_instance.create.assert_called_once()
 
 
-@patch('src.api.CLIGenerator')
+@patch('src.generator.lib.CLIGenerator')
 def test_create_cli_with_root(mock_cli_generator):
     mock_generator_instance = MagicMock()
     mock_cli_generator.return_value = mock_generator_instance
@@ -135,7 +135,7 @@ def test_create_cli_with_root(mock_cli_generator):
     mock_generator_instance.create.assert_called_once()
 
 
-@patch('src.api.MonorepoGenerator')
+@patch('src.generator.monorepo.MonorepoGenerator')
 def test_create_monorepo_basic(mock_monorepo_generator):
     mock_generator_instance = MagicMock()
     mock_monorepo_generator.return_value = mock_generator_instance
@@ -156,7 +156,7 @@ def test_create_monorepo_basic(mock_monorepo_generator):
     mock_generator_instance.create.assert_called_once()
 
 
-@patch('src.api.SystemGenerator')
+@patch('src.generator.system.SystemGenerator')
 def test_create_system_basic(mock_system_generator):
     mock_generator_instance = MagicMock()
     mock_system_generator.return_value = mock_generator_instance
@@ -177,7 +177,7 @@ def test_create_system_basic(mock_system_generator):
     mock_generator_instance.create.assert_called_once()
 
 
-@patch('src.api.MonorepoGenerator')
+@patch('src.generator.monorepo.MonorepoGenerator')
 def test_create_monorepo_with_helm_and_root(mock_monorepo_generator):
     mock_generator_instance = MagicMock()
     mock_monorepo_generator.return_value = mock_generator_instance
@@ -198,7 +198,7 @@ def test_create_monorepo_with_helm_and_root(mock_monorepo_generator):
     mock_generator_instance.create.assert_called_once()
 
 
-@patch('src.api.MonorepoGenerator')
+@patch('src.generator.monorepo.MonorepoGenerator')
 def test_create_monorepo_with_cloud_and_knowledge(mock_monorepo_generator):
     mock_generator_instance = MagicMock()
     mock_monorepo_generator.return_value = mock_generator_instance
@@ -225,7 +225,7 @@ def test_create_monorepo_with_cloud_and_knowledge(mock_monorepo_generator):
     mock_generator_instance.create.assert_called_once()
 
 
-@patch('src.api.ServiceGenerator')
+@patch('src.generator.service.ServiceGenerator')
 def test_create_service_with_runtime(mock_service_generator):
     mock_generator_instance = MagicMock()
     mock_service_generator.return_value = mock_generator_instance
@@ -248,7 +248,7 @@ def test_create_service_with_runtime(mock_service_generator):
     mock_generator_instance.create.assert_called_once()
 
 
-@patch('src.api.MonorepoGenerator')
+@patch('src.generator.monorepo.MonorepoGenerator')
 def test_create_monorepo_with_runtime(mock_monorepo_generator):
     mock_generator_instance = MagicMock()
     mock_monorepo_generator.return_value = mock_generator_instance
@@ -269,7 +269,7 @@ def test_create_monorepo_with_runtime(mock_monorepo_generator):
     mock_generator_instance.create.assert_called_once()
 
 
-@patch('src.api.ServiceGenerator')
+@patch('src.generator.service.ServiceGenerator')
 def test_create_service_generator_exception_propagates(mock_service_generator):
     mock_generator_instance = MagicMock()
     mock_generator_instance.create.side_effect = ValueError("Test error")
@@ -279,7 +279,7 @@ def test_create_service_generator_exception_propagates(mock_service_generator):
         create_service("test", "python", True, {})
 
 
-@patch('src.api.FrontendGenerator')
+@patch('src.generator.frontend.FrontendGenerator')
 def test_create_frontend_generator_exception_propagates(mock_frontend_generator):
     mock_generator_instance = MagicMock()
     mock_generator_instance.create.side_effect = RuntimeError("Frontend error")
@@ -289,7 +289,7 @@ def test_create_frontend_generator_exception_propagates(mock_frontend_generator)
         create_frontend("test", True, {})
 
 
-@patch('src.api.LibraryGenerator')
+@patch('src.generator.lib.LibraryGenerator')
 def test_create_lib_generator_exception_propagates(mock_lib_generator):
     mock_generator_instance = MagicMock()
     mock_generator_instance.create.side_effect = OSError("File system error")
@@ -299,7 +299,7 @@ def test_create_lib_generator_exception_propagates(mock_lib_generator):
         create_lib("test", "python", True, {})
 
 
-@patch('src.api.CLIGenerator')
+@patch('src.generator.lib.CLIGenerator')
 def test_create_cli_generator_exception_propagates(mock_cli_generator):
     mock_generator_instance = MagicMock()
     mock_generator_instance.create.side_effect = KeyError("Missing key")
@@ -309,7 +309,7 @@ def test_create_cli_generator_exception_propagates(mock_cli_generator):
         create_cli("test", "go", False, {})
 
 
-@patch('src.api.MonorepoGenerator')
+@patch('src.generator.monorepo.MonorepoGenerator')
 def test_create_monorepo_generator_exception_propagates(mock_monorepo_generator):
     mock_generator_instance = MagicMock()
     mock_generator_instance.create.side_effect = ImportError("Module not found")
@@ -340,7 +340,7 @@ def test_parameter_validation_types():
     # These should not raise type errors during runtime
     # (static type checking would catch these at development time)
     
-    with patch('src.api.ServiceGenerator') as mock_gen:
+    with patch('src.generator.service.ServiceGenerator') as mock_gen:
         mock_gen.return_value.create = MagicMock()
         
         # Test string parameters
@@ -359,12 +359,12 @@ def test_parameter_validation_types():
 def test_optional_parameters_default_behavior():
     """Test that optional parameters have correct default behavior."""
     
-    with patch('src.api.ServiceGenerator') as mock_service_gen, \
-         patch('src.api.FrontendGenerator') as mock_frontend_gen, \
-         patch('src.api.LibraryGenerator') as mock_lib_gen, \
-         patch('src.api.CLIGenerator') as mock_cli_gen, \
-         patch('src.api.SystemGenerator') as mock_system_gen, \
-         patch('src.api.MonorepoGenerator') as mock_monorepo_gen:
+    with patch('src.generator.service.ServiceGenerator') as mock_service_gen, \
+         patch('src.generator.frontend.FrontendGenerator') as mock_frontend_gen, \
+         patch('src.generator.lib.LibraryGenerator') as mock_lib_gen, \
+         patch('src.generator.lib.CLIGenerator') as mock_cli_gen, \
+         patch('src.generator.system.SystemGenerator') as mock_system_gen, \
+         patch('src.generator.monorepo.MonorepoGenerator') as mock_monorepo_gen:
         
         # Setup mocks
         for mock_gen in [
@@ -56,3 +56,24 @@ def test_load_config_no_files():
     with patch('pathlib.Path.exists', return_value=False):
         config = load_config()
         assert config == {} 
+
+def test_load_config_reuses_parse_until_file_changes(tmp_path):
+    config_path = tmp_path / ".kickstart.toml"
+    config_path.write_text(toml.dumps({"key1": "value1"}))
+
+    with patch('pathlib.Path.cwd', return_value=tmp_path), \
+         patch('src.utils.config.toml.load', wraps=toml.load) as toml_load:
+        assert load_config()["key1"] == "value1"
+        assert load_config()["key1"] == "value1"
+        assert toml_load.call_count == 1
+
+        config_path.write_text(toml.dumps({"key1": "changed value"}))
+        assert load_config()["key1"] == "changed value"
+        assert toml_load.call_count == 2
+
+def test_load_config_result_does_not_alias_cache(tmp_path):
+    (tmp_path / ".kickstart.toml").write_text(toml.dumps({"key1": "value1"}))
+
+    with patch('pathlib.Path.cwd', return_value=tmp_path):
+        load_config()["key1"] = "mutated"
+        assert load_config()["key1"] == "value1"
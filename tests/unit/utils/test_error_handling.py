@@ -386,6 +386,13 @@ def test_validate_language_support_rejects_unsupported_language():
         validate_language_support("cobol", ["python", "rust"])
 
 
+def test_validate_language_support_accepts_frozenset_and_lists_languages_sorted():
+    validate_language_support("go", frozenset({"rust", "go"}))
+
+    with pytest.raises(LanguageNotSupportedError, match="Supported languages: go, rust"):
+        validate_language_support("cobol", frozenset({"rust", "go"}))
+
+
 # --- ensure_directory_exists -------------------------------------------------------
 
 def test_ensure_directory_exists_true_when_already_present(tmp_path: Path):
@@ -0,0 +1,52 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from src.utils.extension_manager import Extension, ExtensionConfig
+
+
+class _Writer:
+    def __init__(self, template_dir: Path) -> None:
+        self.template_dir = template_dir
+
+    def write_template(self, target, template_path, **vars):
+        return True
+
+    def create_directories(self, directories):
+        return True
+
+    def write_content(self, target_path, content):
+        return True
+
+
+def _extension(requirements_file: str) -> Extension:
+    return Extension(
+        ExtensionConfig(
+            name="postgres",
+            extension_type="database",
+            templates=(),
+            requirements_file=requirements_file,
+        )
+    )
+
+
+def test_requirements_skip_comments_and_blank_lines(tmp_path):
+    (tmp_path / "requirements.txt.tpl").write_text("# Database\nasyncpg\n\n  sqlalchemy  \n")
+
+    assert _extension("requirements.txt.tpl").apply(_Writer(tmp_path)) == ["asyncpg", "sqlalchemy"]
+
+
+def test_requirements_template_is_parsed_once(tmp_path):
+    (tmp_path / "requirements.txt.tpl").write_text("asyncpg\n")
+    extension = _extension("requirements.txt.tpl")
+
+    with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as read_text:
+        first = extension.apply(_Writer(tmp_path))
+        first.append("mutated")
+        second = extension.apply(_Writer(tmp_path))
+
+    assert read_text.call_count == 1
+    assert second == ["asyncpg"]
+
+
+def test_missing_requirements_template_returns_no_requirements(tmp_path):
+    assert _extension("missing.txt.tpl").apply(_Writer(tmp_path)) == []
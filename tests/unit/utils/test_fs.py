@@ -1,3 +1,4 @@
+import os
 from unittest.mock import patch
 
 import pytest
@@ -90,3 +91,63 @@ def test_write_file_with_broken_inline_template_warns_and_uses_legacy_substituti
     assert output_path.read_text() == "Hello World {% if broken %}"
     mock_warn.assert_called_once()
     assert "legacy {{NAME}} substitution" in mock_warn.call_args.args[0]
+
+
+def test_write_file_reuses_engine_for_templates_under_one_base(tmp_path):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "a.txt").write_text("A {{ name }}")
+    (templates / "b.txt").write_text("B {{ name }}")
+
+    with patch("src.utils.fs.TemplateEngine", wraps=TemplateEngine) as engine_cls:
+        write_file(tmp_path / "a.out", templates / "a.txt", name="x")
+        write_file(tmp_path / "b.out", templates / "b.txt", name="y")
+
+    assert engine_cls.call_count == 1
+    assert (tmp_path / "a.out").read_text() == "A x"
+    assert (tmp_path / "b.out").read_text() == "B y"
+
+
+def test_write_file_rerenders_template_whose_source_changed(tmp_path):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    template_path = templates / "greeting.txt"
+    template_path.write_text("Hello {{ name }}")
+    write_file(tmp_path / "first.out", template_path, name="World")
+
+    template_path.write_text("Goodbye {{ name }}")
+    stat = template_path.stat()
+    os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    write_file(tmp_path / "second.out", template_path, name="World")
+
+    assert (tmp_path / "first.out").read_text() == "Hello World"
+    assert (tmp_path / "second.out").read_text() == "Goodbye World"
+
+
+def test_write_file_with_empty_content_skips_template_engine(tmp_path):
+    output_path = tmp_path / "pkg" / "__init__.py"
+
+    with patch("src.utils.fs.get_template_engine") as get_engine:
+        write_file(output_path, "", service_name="demo")
+
+    get_engine.assert_not_called()
+    assert output_path.read_text() == ""
+
+
+def test_legacy_replace_substitutes_known_placeholders_in_one_pass():
+    from src.utils.fs import _legacy_replace
+
+    content = "{{NAME}} {{name}} {{MISSING}} {% if x %}"
+    result = _legacy_replace(content, {"name": "{{PLACE}}", "place": "Earth"})
+
+    assert result == "{{PLACE}} {{PLACE}} {{MISSING}} {% if x %}"
+
+
+def test_write_file_with_static_content_skips_template_engine(tmp_path):
+    output_path = tmp_path / "src" / "mod.rs"
+
+    with patch("src.utils.fs.get_template_engine") as get_engine:
+        write_file(output_path, "// Module definitions\n", service_name="demo")
+
+    get_engine.assert_not_called()
+    assert output_path.read_text() == "// Module definitions\n"
@@ -0,0 +1,55 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.errors import TemplateError
+from src.utils.template_registry import TemplateInfo, TemplateRegistry
+
+
+def test_list_available_languages_rescans_only_when_template_dir_changes(tmp_path):
+    (tmp_path / "python").mkdir()
+    registry = TemplateRegistry(tmp_path)
+
+    with patch.object(Path, "iterdir", autospec=True, side_effect=Path.iterdir) as iterdir:
+        first = registry.list_available_languages()
+        second = registry.list_available_languages()
+        assert iterdir.call_count == 1
+
+        (tmp_path / "zig").mkdir()
+        third = registry.list_available_languages()
+        assert iterdir.call_count == 2
+
+    assert "python" in first
+    assert first == second
+    assert "zig" in third
+
+
+def test_list_available_languages_includes_newly_registered_language(tmp_path):
+    registry = TemplateRegistry(tmp_path)
+    registry.list_available_languages()
+
+    registry.register_template(
+        TemplateInfo(name="zig_main", path="zig/main.zig", description="", variables=set(), language="zig")
+    )
+
+    assert "zig" in registry.list_available_languages()
+
+
+def test_resolve_template_file_caches_hits_and_raises_on_missing(tmp_path):
+    lang_dir = tmp_path / "python"
+    lang_dir.mkdir()
+    (lang_dir / "main.py.tpl").write_text("print('hi')\n")
+    (tmp_path / "_shared").mkdir()
+    (tmp_path / "_shared" / "Makefile.tpl").write_text("all:\n")
+    registry = TemplateRegistry(tmp_path)
+
+    assert registry.resolve_template_file(lang_dir, "main.py.tpl") == lang_dir / "main.py.tpl"
+    assert registry.resolve_template_file(lang_dir, "_shared/Makefile.tpl") == tmp_path / "_shared/Makefile.tpl"
+
+    with patch.object(Path, "exists", autospec=True) as exists:
+        assert registry.resolve_template_file(lang_dir, "main.py.tpl") == lang_dir / "main.py.tpl"
+        exists.assert_not_called()
+
+    with pytest.raises(TemplateError, match="missing.tpl"):
+        registry.resolve_template_file(lang_dir, "missing.tpl")